@@ -7,6 +7,7 @@ Each agent has a specific role defined by its system_message.
 
 import logging
 import os
+from typing import Optional
 
 try:
     from autogen_agentchat.agents import AssistantAgent, UserProxyAgent
@@ -30,6 +31,7 @@ from core.tools import (
     recommend_content_for_download,
     get_content_item_details,
     queue_download,
+    queue_downloads,
     check_download_status,
     process_download_queue,
     summarize_content,
@@ -38,6 +40,10 @@ from core.tools import (
 
 logger = logging.getLogger(__name__)
 
+# The summarizer ends its final message with this marker so teams can stop
+# as soon as the pipeline is done instead of running out their max_turns
+TASK_COMPLETE_MARKER = "TASK_COMPLETE"
+
 
 def create_ollama_client() -> "OpenAIChatCompletionClient":
     """
@@ -69,7 +75,7 @@ def create_ollama_client() -> "OpenAIChatCompletionClient":
     )
 
 
-def create_content_discovery_agent() -> "AssistantAgent":
+def create_content_discovery_agent(model_client: Optional["OpenAIChatCompletionClient"] = None) -> "AssistantAgent":
     """
     Create the Content Discovery Agent.
     
@@ -78,6 +84,10 @@ def create_content_discovery_agent() -> "AssistantAgent":
     - Filtering sources based on user preferences
     - Managing user subscriptions
     
+    Args:
+        model_client: Model client to use; a new Ollama client is created
+            if not given. Teams pass one shared client to all their agents.
+    
     Returns:
         An AutoGen AssistantAgent configured for content discovery.
     """
@@ -121,7 +131,8 @@ Communication style:
 When users ask about content, ALWAYS use the tools to fetch current data.
 Do NOT make up source names or URLs."""
     
-    model_client = create_ollama_client()
+    if model_client is None:
+        model_client = create_ollama_client()
     
     # Tools for discovery agent
     tools = [
@@ -142,7 +153,7 @@ Do NOT make up source names or URLs."""
     return agent
 
 
-def create_content_download_agent() -> "AssistantAgent":
+def create_content_download_agent(model_client: Optional["OpenAIChatCompletionClient"] = None) -> "AssistantAgent":
     """
     Create the Content Download Agent.
     
@@ -151,6 +162,10 @@ def create_content_download_agent() -> "AssistantAgent":
     - Checking download status
     - Processing download queues
     
+    Args:
+        model_client: Model client to use; a new Ollama client is created
+            if not given.
+    
     Returns:
         An AutoGen AssistantAgent configured for download management.
     """
@@ -163,13 +178,14 @@ Your role is to queue and manage content downloads recommended by the Discovery
 You can download files from S3/Supabase to local storage for offline access.
 
 You have access to these tools:
-- queue_download(user_id, content_item_id): Add content to download queue using Content ID
+- queue_downloads(user_id, content_item_ids): Add several Content IDs to the download queue in one call
+- queue_download(user_id, content_item_id): Add a single Content ID to the download queue
 - check_download_status(download_item_id): Check status of a specific download
 - process_download_queue(user_id): Start background downloads for all queued items
 
 Your workflow:
 1. Listen for recommendations from the Discovery Agent
-2. When you receive Content IDs (e.g., [123, 124, 125]), call queue_download for each one
+2. When you receive Content IDs (e.g., [123, 124, 125]), call queue_downloads once with the whole list
 3. **CRITICAL**: After queuing ALL items, you MUST call process_download_queue(user_id) to start downloads
 4. Report back with Download Item IDs and confirm download tasks started
 
@@ -181,9 +197,7 @@ Example:
 Discovery Agent says: "Download Agent, queue these Content IDs: [123, 124, 125]"
 
 You respond:
-- queue_download(user_id=1, content_item_id=123) → Download ID 501 queued
-- queue_download(user_id=1, content_item_id=124) → Download ID 502 queued
-- queue_download(user_id=1, content_item_id=125) → Download ID 503 queued
+- queue_downloads(user_id=1, content_item_ids=[123, 124, 125]) → Download IDs 501, 502, 503 queued
 - process_download_queue(user_id=1) → Started 3 background download tasks
 
 "✓ Queued 3 items successfully! Download IDs: [501, 502, 503]
@@ -200,12 +214,14 @@ Communication style:
 - Alert users about any issues
 
 When managing downloads, ALWAYS use the tools to interact with the system.
-The queue_download tool requires content_item_id from Discovery Agent recommendations."""
+The queue_downloads/queue_download tools require Content IDs from Discovery Agent recommendations."""
     
-    model_client = create_ollama_client()
+    if model_client is None:
+        model_client = create_ollama_client()
     
     # Tools for download agent
     tools = [
+        queue_downloads,
         queue_download,
         check_download_status,
         process_download_queue,
@@ -222,7 +238,7 @@ The queue_download tool requires content_item_id from Discovery Agent recommenda
     return agent
 
 
-def create_content_summarizer_agent() -> "AssistantAgent":
+def create_content_summarizer_agent(model_client: Optional["OpenAIChatCompletionClient"] = None) -> "AssistantAgent":
     """
     Create the Content Summarizer Agent (SKELETON).
     
@@ -234,13 +250,17 @@ def create_content_summarizer_agent() -> "AssistantAgent":
     Note: This is a skeleton implementation for Sprint 1.
     Full functionality will be implemented in Sprint 2.
     
+    Args:
+        model_client: Model client to use; a new Ollama client is created
+            if not given.
+    
     Returns:
         An AutoGen AssistantAgent configured for content analysis.
     """
     if not autogen_available:
         raise ImportError("pyautogen is required. Install with: pip install pyautogen 'autogen-ext[openai]'")
     
-    system_message = """You are a Content Quality Analyst for SmartCache AI.
+    system_message = f"""You are a Content Quality Analyst for SmartCache AI.
 
 [SPRINT 1 - SKELETON] Your full capabilities are under development.
 
@@ -265,9 +285,13 @@ Communication style:
 - Use the stub tools to show the workflow
 
 When asked to analyze content, call the stub tools to demonstrate
-the planned functionality."""
+the planned functionality.
+
+When your analysis is finished, end your final message with the word
+{TASK_COMPLETE_MARKER} on its own line."""
     
-    model_client = create_ollama_client()
+    if model_client is None:
+        model_client = create_ollama_client()
     
     # Tools for summarizer agent (stubs)
     tools = [
@@ -11,13 +11,14 @@ import logging
 
 try:
     from autogen_agentchat.teams import RoundRobinGroupChat, SelectorGroupChat
-    from autogen_agentchat.conditions import MaxMessageTermination
+    from autogen_agentchat.conditions import MaxMessageTermination, TextMentionTermination
     from autogen_agentchat.base import TaskResult
     autogen_teams_available = True
 except ImportError as e:
     RoundRobinGroupChat = None
     SelectorGroupChat = None
     MaxMessageTermination = None
+    TextMentionTermination = None
     TaskResult = None
     autogen_teams_available = False
     logging.warning(f"autogen-agentchat teams not available. Error: {e}")
@@ -27,6 +28,7 @@ from .definitions import (
     create_content_download_agent,
     create_content_summarizer_agent,
     create_ollama_client,
+    TASK_COMPLETE_MARKER,
 )
 
 logger = logging.getLogger(__name__)
@@ -59,17 +61,22 @@ def create_round_robin_team(
             "Install with: pip install pyautogen 'autogen-ext[openai]'"
         )
     
-    # Create all agents
-    discovery_agent = create_content_discovery_agent()
-    download_agent = create_content_download_agent()
-    summarizer_agent = create_content_summarizer_agent()
+    # Create all agents on one shared model client (one HTTP connection pool
+    # to Ollama per team instead of one per agent)
+    model_client = create_ollama_client()
+    discovery_agent = create_content_discovery_agent(model_client)
+    download_agent = create_content_download_agent(model_client)
+    summarizer_agent = create_content_summarizer_agent(model_client)
     
     # In the new API, we don't use UserProxyAgent in teams
     # The team itself handles the conversation orchestration
     participants = [discovery_agent, download_agent, summarizer_agent]
     
-    # Create termination condition
-    termination = MaxMessageTermination(max_messages=max_turns)
+    # Stop when the summarizer signals completion, or at max_turns at worst
+    termination = (
+        TextMentionTermination(TASK_COMPLETE_MARKER, sources=[summarizer_agent.name])
+        | MaxMessageTermination(max_messages=max_turns)
+    )
     
     # Create RoundRobinGroupChat team
     team = RoundRobinGroupChat(
@@ -87,6 +94,28 @@ def create_round_robin_team(
     return team
 
 
+def _pipeline_selector(discovery_agent, download_agent, summarizer_agent):
+    """
+    Build a selector_func that follows the pipeline's fixed hand-offs.
+    
+    Discovery always hands to Download and Download to Summarizer, so those
+    turns are routed in Python without spending an LLM call on the selector.
+    Anything else returns None and falls back to the model-based selector.
+    """
+    handoffs = {
+        'user': discovery_agent.name,
+        discovery_agent.name: download_agent.name,
+        download_agent.name: summarizer_agent.name,
+    }
+    
+    def select_next_speaker(messages):
+        if not messages:
+            return discovery_agent.name
+        return handoffs.get(messages[-1].source)
+    
+    return select_next_speaker
+
+
 def create_selector_team(
     max_turns: int = 10,
     team_name: str = "ContentPipelineTeam",
@@ -95,7 +124,9 @@ def create_selector_team(
     Create a SelectorGroupChat team where an LLM selects which agent speaks next.
     
     In the new API, SelectorGroupChat uses an LLM to intelligently choose
-    which agent should respond based on the conversation context.
+    which agent should respond based on the conversation context. The
+    pipeline's fixed hand-offs (Discovery -> Download -> Summarizer) are
+    routed directly; the LLM is only consulted for the remaining turns.
     
     Args:
         max_turns: Maximum number of conversation turns (default: 10)
@@ -114,18 +145,20 @@ def create_selector_team(
             "Install with: pip install pyautogen 'autogen-ext[openai]'"
         )
     
-    # Create all agents
-    discovery_agent = create_content_discovery_agent()
-    download_agent = create_content_download_agent()
-    summarizer_agent = create_content_summarizer_agent()
+    # Create all agents on one shared model client (one HTTP connection pool
+    # to Ollama per team instead of one per agent)
+    model_client = create_ollama_client()
+    discovery_agent = create_content_discovery_agent(model_client)
+    download_agent = create_content_download_agent(model_client)
+    summarizer_agent = create_content_summarizer_agent(model_client)
     
     participants = [discovery_agent, download_agent, summarizer_agent]
     
-    # Create termination condition
-    termination = MaxMessageTermination(max_messages=max_turns)
-    
-    # Create a model client for the selector (to decide who speaks next)
-    selector_model = create_ollama_client()
+    # Stop when the summarizer signals completion, or at max_turns at worst
+    termination = (
+        TextMentionTermination(TASK_COMPLETE_MARKER, sources=[summarizer_agent.name])
+        | MaxMessageTermination(max_messages=max_turns)
+    )
     
     # Custom selector prompt for content pipeline
     selector_prompt = """You are managing a content pipeline with these agents:
@@ -148,12 +181,13 @@ Who should speak next? Only return the agent name from {participants}."""
     # Create SelectorGroupChat team
     team = SelectorGroupChat(
         participants=participants,
-        model_client=selector_model,
+        model_client=model_client,  # Selector (who speaks next) shares it too
         name=team_name,
         description="A team of agents that discover, download, and analyze content",
         termination_condition=termination,
         max_turns=max_turns,
         selector_prompt=selector_prompt,
+        selector_func=_pipeline_selector(discovery_agent, download_agent, summarizer_agent),
         allow_repeated_speaker=False,  # Force different agents to speak
     )
     
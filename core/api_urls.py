@@ -1,4 +1,5 @@
 from django.urls import path, include
+from rest_framework.authtoken.views import obtain_auth_token
 from rest_framework.routers import DefaultRouter
 from . import views
 
@@ -18,6 +19,7 @@ urlpatterns = [
     path('auth/login/', views.login_user, name='login'),
     path('auth/logout/', views.logout_user, name='logout'),
     path('auth/me/', views.current_user, name='current_user'),
+    path('auth/token/', obtain_auth_token, name='auth_token'),
     # Download file endpoint
     path('downloads/<int:download_id>/file/', views.download_file, name='download_file'),
     # ETL Pipeline endpoints (for demo/presentation)
@@ -103,17 +103,15 @@ When finished, summarize what was accomplished and reply with TERMINATE.
         # Get the last few messages
         messages = user_proxy.chat_messages[manager]
         
-        result_summary = "\n" + "="*60 + "\n"
-        result_summary += "AGENT CONVERSATION SUMMARY\n"
-        result_summary += "="*60 + "\n\n"
+        # Build the summary as a list of parts and join once
+        parts = ["\n" + "="*60 + "\n", "AGENT CONVERSATION SUMMARY\n", "="*60 + "\n\n"]
         
         for msg in messages[-5:]:  # Last 5 messages
-            role = msg.get("role", "unknown")
-            name = msg.get("name", role)
-            content = msg.get("content", "")
-            result_summary += f"[{name}]:\n{content}\n\n"
+            name = msg.get("name", msg.get("role", "unknown"))
+            parts.append(f"[{name}]:\n{msg.get('content', '')}\n\n")
         
-        result_summary += "="*60 + "\n"
+        parts.append("="*60 + "\n")
+        result_summary = "".join(parts)
         
         logger.info("Pipeline execution completed successfully")
         return result_summary
@@ -11,7 +11,7 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth.models import User
 from django.contrib.auth import get_user
-from core.agents.groupchat import create_round_robin_team
+from django.db.models import Count
 from core.models import DownloadItem
 
 logger = logging.getLogger(__name__)
@@ -113,6 +113,13 @@ class AgentExecutionConsumer(AsyncWebsocketConsumer):
     async def run_agents(self, max_items: int):
         """Run the agent team and send updates."""
         try:
+            # Imported here so the ASGI process doesn't load AutoGen and the
+            # OpenAI client stack at startup, only when agents actually run.
+            # Inside the try so an ImportError reaches the client as an error
+            from autogen_agentchat.base import TaskResult
+            from autogen_agentchat.messages import BaseChatMessage
+            from core.agents.groupchat import create_round_robin_team
+            
             # Create task for agent execution
             task = f"I'm user ID {self.user_id}. Find and download up to {max_items} new content items for me based on my subscriptions and preferences."
             
@@ -137,17 +144,22 @@ class AgentExecutionConsumer(AsyncWebsocketConsumer):
                 'message': 'Starting agent conversation...',
             }))
             
-            # Run the team (check if it's async or sync)
-            try:
-                # Try async first (new API)
-                if asyncio.iscoroutinefunction(team.run):
-                    result = await team.run(task=task)
-                else:
-                    # Sync version - run in thread pool
-                    result = await asyncio.to_thread(team.run, task=task)
-            except AttributeError:
-                # Fallback: run synchronously in thread
-                result = await asyncio.to_thread(team.run, task=task)
+            # Stream the conversation: each agent message is forwarded to the
+            # browser as soon as it is produced instead of only after the
+            # whole run, and the final event is the TaskResult. Tool-using
+            # agents end their turn with a ToolCallSummaryMessage, so every
+            # chat message is sent; tool call request/execution events
+            # (BaseAgentEvent) are skipped
+            result = None
+            async for event in team.run_stream(task=task):
+                if isinstance(event, TaskResult):
+                    result = event
+                elif isinstance(event, BaseChatMessage) and event.source != 'user':
+                    await self.send(text_data=json.dumps({
+                        'type': 'agent_message',
+                        'agent': event.source,
+                        'message': event.to_text(),
+                    }))
             
             # Process results and send updates
             await self.process_agent_results(result)
@@ -163,12 +175,18 @@ class AgentExecutionConsumer(AsyncWebsocketConsumer):
         """Process agent execution results and send summary."""
         try:
             # Get download statistics
-            stats = await database_sync_to_async(self.get_download_stats)(self.user_id)
+            stats = await self.get_download_stats(self.user_id)
+            
+            # Why the team stopped: a TextMentionTermination mention or
+            # hitting the MaxMessageTermination turn cap
+            stop_reason = result.stop_reason if result is not None else None
+            logger.info("Agent run for user %s stopped: %s", self.user_id, stop_reason)
             
             # Send execution complete message
             await self.send(text_data=json.dumps({
                 'type': 'execution_complete',
                 'message': 'Agent execution completed successfully!',
+                'stop_reason': stop_reason,
                 'summary': {
                     'total_downloads': stats['total'],
                     'queued': stats['queued'],
@@ -186,16 +204,28 @@ class AgentExecutionConsumer(AsyncWebsocketConsumer):
             }))
     
     @staticmethod
-    def get_download_stats(user_id: int) -> dict:
-        """Get download statistics for a user."""
-        downloads = DownloadItem.objects.filter(user_id=user_id)
+    async def get_download_stats(user_id: int) -> dict:
+        """
+        Get download statistics for a user.
+        
+        Uses the async ORM directly rather than hopping to the sync thread
+        pool via database_sync_to_async, and counts every status in one
+        GROUP BY query.
+        """
+        status_counts = {
+            status: n
+            async for status, n in DownloadItem.objects.filter(user_id=user_id)
+            .order_by()
+            .values_list('status')
+            .annotate(n=Count('id'))
+        }
         
         return {
-            'total': downloads.count(),
-            'queued': downloads.filter(status='queued').count(),
-            'downloading': downloads.filter(status='downloading').count(),
-            'ready': downloads.filter(status='ready').count(),
-            'failed': downloads.filter(status='failed').count(),
+            'total': sum(status_counts.values()),
+            'queued': status_counts.get('queued', 0),
+            'downloading': status_counts.get('downloading', 0),
+            'ready': status_counts.get('ready', 0),
+            'failed': status_counts.get('failed', 0),
         }
     
     # Handler for group messages
@@ -22,28 +22,33 @@ class Command(BaseCommand):
             },
         ]
 
-        created_count = 0
-        skipped_count = 0
+        # One query for the names already present and one INSERT for the
+        # rest, instead of a get_or_create round trip per source
+        existing_names = set(ContentSource.objects.filter(
+            name__in=[source_data['name'] for source_data in meme_sources]
+        ).values_list('name', flat=True))
 
+        to_create = []
         for source_data in meme_sources:
-            source, created = ContentSource.objects.get_or_create(
+            if source_data['name'] in existing_names:
+                self.stdout.write(f'- Skipped (exists): {source_data["name"]}')
+                continue
+
+            source = ContentSource(
                 name=source_data['name'],
-                defaults={
-                    'type': 'meme',
-                    'feed_url': f"https://reddit.com/r/{source_data['feed_url']}",
-                    'policy': source_data['policy'],
-                    'is_active': True,
-                }
+                type='meme',
+                feed_url=f"https://reddit.com/r/{source_data['feed_url']}",
+                policy=source_data['policy'],
+                is_active=True,
+            )
+            to_create.append(source)
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Created: {source.name} (r/{source_data["feed_url"]})')
             )
-            
-            if created:
-                created_count += 1
-                self.stdout.write(
-                    self.style.SUCCESS(f'✓ Created: {source.name} (r/{source_data["feed_url"]})')
-                )
-            else:
-                skipped_count += 1
-                self.stdout.write(f'- Skipped (exists): {source.name}')
+
+        ContentSource.objects.bulk_create(to_create)
+        created_count = len(to_create)
+        skipped_count = len(meme_sources) - created_count
 
         self.stdout.write('')
         self.stdout.write(
@@ -11,7 +11,8 @@ Usage:
 """
 
 from django.core.management.base import BaseCommand
-from core.models import ContentSource, ContentItem
+from django.db.models import Count, Q
+from core.models import ContentSource
 
 
 class Command(BaseCommand):
@@ -35,7 +36,10 @@ class Command(BaseCommand):
             type__in=['article', 'video']  # Articles (RSS) and Videos (YouTube blocked)
         )
         
-        count = sources_to_remove.count()
+        # Fetched once and reused for the count and the listing below; item
+        # counts come back on each row instead of one COUNT per source
+        sources_list = list(sources_to_remove.annotate(items_count=Count('contentitem')))
+        count = len(sources_list)
         
         if count == 0:
             self.stdout.write(self.style.SUCCESS('✅ No metadata_only sources found. All clean!'))
@@ -43,9 +47,8 @@ class Command(BaseCommand):
         
         self.stdout.write(f'\nFound {count} sources to {"delete" if delete_mode else "deactivate"}:\n')
         
-        for source in sources_to_remove:
-            items_count = ContentItem.objects.filter(source=source).count()
-            self.stdout.write(f'  ❌ {source.name} ({source.type}, {source.policy}) - {items_count} items')
+        for source in sources_list:
+            self.stdout.write(f'  ❌ {source.name} ({source.type}, {source.policy}) - {source.items_count} items')
         
         if delete_mode:
             # Delete the sources (and their content items via CASCADE)
@@ -57,9 +60,13 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS(f'\n✅ Deactivated {count} sources.'))
         
         # Show remaining active sources
-        active_sources = ContentSource.objects.filter(is_active=True)
-        self.stdout.write(f'\n📋 Remaining active sources ({active_sources.count()}):')
+        active_sources = list(ContentSource.objects.filter(is_active=True).annotate(
+            items_count=Count(
+                'contentitem',
+                filter=Q(contentitem__storage_provider__in=['aws_s3', 'supabase']),
+            )
+        ))
+        self.stdout.write(f'\n📋 Remaining active sources ({len(active_sources)}):')
         for source in active_sources:
-            items_count = ContentItem.objects.filter(source=source, storage_provider__in=['aws_s3', 'supabase']).count()
-            self.stdout.write(self.style.SUCCESS(f'  ✅ {source.name} ({source.type}) - {items_count} items with S3'))
+            self.stdout.write(self.style.SUCCESS(f'  ✅ {source.name} ({source.type}) - {source.items_count} items with S3'))
 
@@ -11,18 +11,25 @@ class Command(BaseCommand):
     help = 'Create default UserPreference for all users that do not have one'
 
     def handle(self, *args, **options):
-        users_without_prefs = User.objects.filter(userpreference__isnull=True)
-        count = 0
+        users_without_prefs = list(User.objects.filter(userpreference__isnull=True))
+        
+        # One batched INSERT instead of a create() round trip per user
+        UserPreference.objects.bulk_create(
+            [
+                UserPreference(
+                    user=user,
+                    topics=[],
+                    max_daily_items=10,
+                    max_storage_mb=500
+                )
+                for user in users_without_prefs
+            ],
+            batch_size=500,
+        )
         
         for user in users_without_prefs:
-            UserPreference.objects.create(
-                user=user,
-                topics=[],
-                max_daily_items=10,
-                max_storage_mb=500
-            )
             self.stdout.write(f'Created preferences for: {user.username}')
-            count += 1
+        count = len(users_without_prefs)
         
         if count == 0:
             self.stdout.write(self.style.SUCCESS('All users already have preferences!'))
@@ -15,6 +15,12 @@ import re
 from datetime import datetime
 from urllib.parse import unquote
 
+NON_ALNUM_SPACE_RE = re.compile(r'[^a-z0-9\s]')
+NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+WHITESPACE_RE = re.compile(r'\s+')
+WORD_RE = re.compile(r'[a-z]+')
+EXTENSION_RE = re.compile(r'\.[^.]+$')
+
 
 class Command(BaseCommand):
     help = 'Recover ContentItem records from existing S3 content'
@@ -60,8 +66,8 @@ class Command(BaseCommand):
         for source in ContentSource.objects.all():
             # Normalize: lowercase, remove parentheses, dashes, underscores
             normalized = source.name.lower()
-            normalized = re.sub(r'[^a-z0-9\s]', '', normalized)  # Remove special chars
-            normalized = re.sub(r'\s+', '', normalized)  # Remove spaces
+            normalized = NON_ALNUM_SPACE_RE.sub('', normalized)  # Remove special chars
+            normalized = WHITESPACE_RE.sub('', normalized)  # Remove spaces
             sources_normalized[normalized] = source
             
             # Also add without spaces
@@ -74,6 +80,13 @@ class Command(BaseCommand):
             if source.type not in source_by_type:
                 source_by_type[source.type] = source
         
+        # Per-source cleaned names and word sets for the fuzzy matching below,
+        # computed once rather than for every S3 object
+        source_match_keys = [
+            (NON_ALNUM_RE.sub('', name), set(WORD_RE.findall(name)), src)
+            for name, src in sources.items()
+        ]
+        
         self.stdout.write(f'Loaded {len(sources)} sources')
         
         for page in paginator.paginate(Bucket=bucket_name):
@@ -118,24 +131,22 @@ class Command(BaseCommand):
                 if source_name_from_path:
                     # Normalize the path name
                     path_normalized = source_name_from_path.lower()
-                    path_normalized_clean = re.sub(r'[^a-z0-9]', '', path_normalized)
+                    path_normalized_clean = NON_ALNUM_RE.sub('', path_normalized)
                     
                     # Try normalized match
                     if path_normalized_clean in sources_normalized:
                         source = sources_normalized[path_normalized_clean]
                     else:
                         # Try partial match
-                        for name, src in sources.items():
-                            name_clean = re.sub(r'[^a-z0-9]', '', name)
+                        for name_clean, _, src in source_match_keys:
                             if path_normalized_clean in name_clean or name_clean in path_normalized_clean:
                                 source = src
                                 break
                         
                         # Try matching path parts
                         if not source:
-                            path_words = set(re.findall(r'[a-z]+', path_normalized))
-                            for name, src in sources.items():
-                                name_words = set(re.findall(r'[a-z]+', name))
+                            path_words = set(WORD_RE.findall(path_normalized))
+                            for _, name_words, src in source_match_keys:
                                 # If most words match
                                 if len(path_words & name_words) >= min(2, len(path_words)):
                                     source = src
@@ -170,7 +181,7 @@ class Command(BaseCommand):
                 filename = parts[-1]
                 title = unquote(filename)
                 # Remove extension
-                title = re.sub(r'\.[^.]+$', '', title)
+                title = EXTENSION_RE.sub('', title)
                 # Clean up
                 title = title.replace('-', ' ').replace('_', ' ')
                 title = ' '.join(word.capitalize() for word in title.split())
@@ -11,12 +11,15 @@ Usage:
     python manage.py run_etl                    # Ingest all sources
     python manage.py run_etl --source 1         # Ingest specific source by ID
     python manage.py run_etl --source-name NPR  # Ingest by source name
+    python manage.py run_etl --workers 8        # Ingest 8 sources at a time
 """
 
 import sys
 import time
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
-from core.models import ContentSource, ContentItem
+from django.db.models import Count
+from core.models import ContentSource, ContentItem, ContentItemQuerySet
 from core.services.content_ingestion import ContentIngestionService
 
 
@@ -47,6 +50,13 @@ class Command(BaseCommand):
             choices=['aws_s3', 'supabase', 'none'],
             help='Storage provider to use (overrides settings)',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Sources to ingest concurrently when running all sources '
+                 '(default: settings.ETL_MAX_WORKERS or 4)',
+        )
 
     def print_progress_bar(self, current, total, prefix='Progress', suffix='', length=40):
         """Print a progress bar to the console."""
@@ -65,6 +75,14 @@ class Command(BaseCommand):
             f'{sources_done}/{total_sources} sources | {errors} errors'
         )
 
+    def content_counts(self):
+        """Return (total items, items with a storage URL) in one query."""
+        totals = ContentItem.objects.aggregate(
+            total=Count('id'),
+            with_storage=Count('id', filter=ContentItemQuerySet.CACHED),
+        )
+        return totals['total'], totals['with_storage']
+
     def handle(self, *args, **options):
         source_id = options.get('source')
         source_name = options.get('source_name')
@@ -72,10 +90,7 @@ class Command(BaseCommand):
         provider = options.get('provider')
 
         # Get initial counts
-        initial_items = ContentItem.objects.count()
-        initial_with_storage = ContentItem.objects.exclude(
-            storage_url__isnull=True
-        ).exclude(storage_url='').count()
+        initial_items, initial_with_storage = self.content_counts()
 
         # Initialize ETL service
         try:
@@ -95,10 +110,7 @@ class Command(BaseCommand):
                 count = service.ingest_source(source)
                 
                 # Show final stats
-                final_items = ContentItem.objects.count()
-                final_with_storage = ContentItem.objects.exclude(
-                    storage_url__isnull=True
-                ).exclude(storage_url='').count()
+                final_items, final_with_storage = self.content_counts()
                 
                 self.stdout.write('')
                 self.stdout.write(self.style.SUCCESS(f'✓ {count} new items from {source.name}'))
@@ -112,17 +124,17 @@ class Command(BaseCommand):
 
         # Specific source by name
         elif source_name:
-            sources = ContentSource.objects.filter(
+            sources = list(ContentSource.objects.filter(
                 name__icontains=source_name,
                 is_active=True
-            )
+            ))
             
-            if not sources.exists():
+            if not sources:
                 raise CommandError(
                     f'No active sources found matching "{source_name}"'
                 )
             
-            total_sources = sources.count()
+            total_sources = len(sources)
             self.stdout.write(f'\n🔄 Found {total_sources} source(s) matching "{source_name}"\n')
             
             total_items = 0
@@ -151,10 +163,7 @@ class Command(BaseCommand):
             self.print_progress_bar(total_sources, total_sources, prefix='ETL Progress', suffix='Complete!')
             
             # Show final stats
-            final_items = ContentItem.objects.count()
-            final_with_storage = ContentItem.objects.exclude(
-                storage_url__isnull=True
-            ).exclude(storage_url='').count()
+            final_items, final_with_storage = self.content_counts()
             
             self.stdout.write('')
             self.stdout.write('=' * 60)
@@ -173,17 +182,17 @@ class Command(BaseCommand):
 
         # Filter by source type
         elif source_type:
-            sources = ContentSource.objects.filter(
+            sources = list(ContentSource.objects.filter(
                 type=source_type,
                 is_active=True
-            )
+            ))
             
-            if not sources.exists():
+            if not sources:
                 raise CommandError(
                     f'No active sources found with type "{source_type}"'
                 )
             
-            total_sources = sources.count()
+            total_sources = len(sources)
             self.stdout.write(f'\n🔄 Found {total_sources} source(s) of type "{source_type}"\n')
             
             total_items = 0
@@ -218,10 +227,7 @@ class Command(BaseCommand):
             elapsed_total = time.time() - start_time
             
             # Show final stats
-            final_items = ContentItem.objects.count()
-            final_with_storage = ContentItem.objects.exclude(
-                storage_url__isnull=True
-            ).exclude(storage_url='').count()
+            final_items, final_with_storage = self.content_counts()
             
             self.stdout.write('')
             self.stdout.write('=' * 60)
@@ -236,46 +242,52 @@ class Command(BaseCommand):
 
         # All sources
         else:
-            sources = ContentSource.objects.filter(is_active=True)
-            total_sources = sources.count()
+            sources = list(ContentSource.objects.filter(is_active=True))
+            total_sources = len(sources)
+            max_workers = options.get('workers') or getattr(settings, 'ETL_MAX_WORKERS', 4)
             
             self.stdout.write('')
             self.stdout.write('=' * 60)
-            self.stdout.write(f'🔄 ETL Pipeline - {total_sources} sources')
+            self.stdout.write(f'🔄 ETL Pipeline - {total_sources} sources ({max_workers} workers)')
             self.stdout.write('=' * 60)
             self.stdout.write('')
             
-            total_new_items = 0
-            errors = 0
             successful_sources = []
             failed_sources = []
+            done = 0
             
             start_time = time.time()
             
-            for idx, source in enumerate(sources, 1):
+            def report(source, count, error):
+                # Called by the service as each source finishes
+                nonlocal done
+                done += 1
+                
                 # Update progress bar
                 elapsed = time.time() - start_time
-                rate = idx / elapsed if elapsed > 0 else 0
-                eta = (total_sources - idx) / rate if rate > 0 else 0
+                rate = done / elapsed if elapsed > 0 else 0
+                eta = (total_sources - done) / rate if rate > 0 else 0
                 
                 self.print_progress_bar(
-                    idx, total_sources,
+                    done, total_sources,
                     prefix='Progress',
                     suffix=f'| ETA: {int(eta)}s | {source.name[:25]}...'
                 )
                 
-                try:
-                    count = service.ingest_source(source)
-                    total_new_items += count
-                    
-                    if count > 0:
-                        successful_sources.append((source.name, count))
-                        # Print success inline
-                        sys.stdout.write(f'\n  ✓ {source.name}: {count} new items\n')
-                        
-                except Exception as e:
-                    errors += 1
-                    failed_sources.append((source.name, str(e)[:50]))
+                if error is not None:
+                    failed_sources.append((source.name, str(error)[:50]))
+                elif count > 0:
+                    successful_sources.append((source.name, count))
+                    # Print success inline
+                    sys.stdout.write(f'\n  ✓ {source.name}: {count} new items\n')
+            
+            # Feeds are dominated by network latency, so the service fetches
+            # several at once and reports each source as it finishes
+            summary = service.ingest_all_sources(
+                max_workers=max_workers, on_source_done=report
+            )
+            total_new_items = summary['total_items_added']
+            errors = summary['errors']
             
             # Final progress
             self.print_progress_bar(total_sources, total_sources, prefix='Progress', suffix='Complete!')
@@ -283,10 +295,7 @@ class Command(BaseCommand):
             elapsed_total = time.time() - start_time
             
             # Get final counts
-            final_items = ContentItem.objects.count()
-            final_with_storage = ContentItem.objects.exclude(
-                storage_url__isnull=True
-            ).exclude(storage_url='').count()
+            final_items, final_with_storage = self.content_counts()
             
             # Summary
             self.stdout.write('')
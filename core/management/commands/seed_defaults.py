@@ -1,9 +1,13 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from core.models import ContentSource
 
 class Command(BaseCommand):
     help = 'Seed default content sources (podcasts, news, memes)'
 
+    # The upserts and the article cleanup commit together, instead of one
+    # autocommit per source
+    @transaction.atomic
     def handle(self, *args, **options):
         sources = [
             # ========== PODCASTS ==========
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-16 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_downloaditem_description_alter_contentsource_type"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="downloaditem",
+            index=models.Index(
+                fields=["user", "-created_at"], name="core_downlo_user_id_0f4266_idx"
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import User
 from django.utils import timezone
 import json
@@ -67,6 +68,15 @@ class ContentSource(models.Model):
     def __str__(self):
         return f"{self.name} ({self.get_type_display()})"
 
+class ContentItemQuerySet(models.QuerySet):
+    # Media has been cached in S3/Supabase; only these items may be
+    # recommended for download. Also usable as an aggregate filter.
+    CACHED = Q(storage_url__isnull=False) & ~Q(storage_url='')
+    
+    def cached(self):
+        """Items whose media is stored in S3/Supabase."""
+        return self.filter(self.CACHED)
+
 class ContentItem(models.Model):
     """
     Individual content item discovered from a source.
@@ -109,6 +119,8 @@ class ContentItem(models.Model):
     # Prevent duplicates
     guid = models.CharField(max_length=500, unique=True)  # RSS GUID or hash
     
+    objects = ContentItemQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-published_at']
         indexes = [
@@ -154,6 +166,11 @@ class DownloadItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
+    
     def __str__(self):
         return f"{self.title} [{self.get_status_display()}]"
 
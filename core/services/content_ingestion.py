@@ -15,20 +15,32 @@ import logging
 import hashlib
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 from time import mktime
+from urllib.parse import urlparse
 
 import feedparser
 import requests
+from django.core.cache import cache
+from django.db import connections
 from django.utils import timezone
 from django.conf import settings
 
 from core.models import ContentSource, ContentItem
+from core.services.http_session import get_http_session
 from core.services.storage_service import get_storage_service, StorageService
 
 logger = logging.getLogger(__name__)
 
+# Streaming read size for media downloads (episodes/videos run to hundreds of MB)
+MEDIA_CHUNK_SIZE = 256 * 1024
+
+# How long a feed's ETag/Last-Modified validators are remembered; after that
+# the next fetch is unconditional, so purged content is picked up again
+FEED_VALIDATORS_TTL = 24 * 60 * 60
+
 
 class ContentIngestionService:
     """
@@ -81,40 +93,78 @@ class ContentIngestionService:
         else:
             raise ValueError(f"Unsupported storage provider: {self.storage_provider}")
     
-    def ingest_all_sources(self) -> Dict[str, any]:
+    def ingest_all_sources(
+        self,
+        max_workers: Optional[int] = None,
+        on_source_done: Optional[Callable[[ContentSource, Optional[int], Optional[Exception]], None]] = None,
+    ) -> Dict[str, any]:
         """
         Main ETL entry point: fetch content from all active sources.
         
+        Sources are ingested concurrently on a bounded thread pool since each
+        one is dominated by remote HTTP latency.
+        
+        Args:
+            max_workers: Sources to ingest at once (default: settings.ETL_MAX_WORKERS or 4)
+            on_source_done: Optional callback, run on the calling thread as each
+                source finishes, with (source, items_added, error); exactly one
+                of items_added / error is None
+        
         Returns:
             Summary stats: {source_name: items_added, ...}
         """
-        sources = ContentSource.objects.filter(is_active=True)
+        sources = list(ContentSource.objects.filter(is_active=True))
         results = {}
         total_items = 0
         total_errors = 0
         
-        logger.info(f"Starting ingestion for {sources.count()} sources")
+        logger.info(f"Starting ingestion for {len(sources)} sources")
         
-        for source in sources:
-            try:
-                count = self.ingest_source(source)
-                results[source.name] = count
-                total_items += count
-                logger.info(f"✓ {source.name}: {count} new items")
-            except Exception as e:
-                logger.error(f"✗ {source.name}: {e}")
-                results[source.name] = f"ERROR: {str(e)}"
-                total_errors += 1
+        if sources:
+            max_workers = max_workers or getattr(settings, 'ETL_MAX_WORKERS', 4)
+            with ThreadPoolExecutor(max_workers=max(1, min(len(sources), max_workers))) as executor:
+                futures = {
+                    executor.submit(self._ingest_source_in_thread, source): source
+                    for source in sources
+                }
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        count = future.result()
+                    except Exception as e:
+                        logger.error("✗ %s: %s", source.name, e)
+                        results[source.name] = f"ERROR: {str(e)}"
+                        total_errors += 1
+                        if on_source_done:
+                            on_source_done(source, None, e)
+                        continue
+                    results[source.name] = count
+                    total_items += count
+                    logger.info("✓ %s: %d new items", source.name, count)
+                    if on_source_done:
+                        on_source_done(source, count, None)
         
         logger.info(f"Ingestion complete: {total_items} items, {total_errors} errors")
         
         return {
-            'sources_processed': sources.count(),
+            'sources_processed': len(sources),
             'total_items_added': total_items,
             'errors': total_errors,
             'details': results,
         }
     
+    def _ingest_source_in_thread(self, source: ContentSource) -> int:
+        """
+        Run ingest_source() from a worker thread.
+        
+        Django opens one DB connection per thread, so release it when the
+        worker finishes instead of leaking it until the process exits.
+        """
+        try:
+            return self.ingest_source(source)
+        finally:
+            connections.close_all()
+    
     def ingest_source(self, source: ContentSource) -> int:
         """
         Fetch and parse content from a single source.
@@ -151,7 +201,16 @@ class ContentIngestionService:
         try:
             # Parse RSS feed
             logger.info(f"Fetching feed: {source.feed_url}")
-            feed = feedparser.parse(str(source.feed_url))
+            # A source with no stored items (new, or its content was purged)
+            # must get the full feed, even if it hasn't changed upstream
+            feed, validators = self._fetch_feed(
+                str(source.feed_url),
+                conditional=ContentItem.objects.filter(source=source).exists(),
+            )
+            
+            if feed is None:
+                logger.info(f"Feed not modified since last fetch: {source.feed_url}")
+                return 0
             
             if feed.bozo:
                 logger.warning(f"Feed has issues: {feed.bozo_exception}")
@@ -160,35 +219,115 @@ class ContentIngestionService:
                 logger.warning(f"No entries found in feed: {source.feed_url}")
                 return 0
             
-            new_items = 0
-            
-            # Process each entry
+            # Parse entries and drop ones we already have
+            pending = []
+            seen_guids = set()
+            failures = 0
             for entry in feed.entries:
                 try:
                     # Create item data dict
                     item_data = self._parse_feed_entry(entry, source)
                     
                     # Check if already exists
-                    if ContentItem.objects.filter(guid=item_data['guid']).exists():
-                        logger.debug(f"Skipping duplicate: {item_data['title']}")
+                    if item_data['guid'] in seen_guids or ContentItem.objects.filter(guid=item_data['guid']).exists():
+                        logger.debug("Skipping duplicate: %s", item_data['title'])
                         continue
                     
+                    seen_guids.add(item_data['guid'])
+                    pending.append(item_data)
+                    
+                except Exception as e:
+                    logger.warning(f"Failed to process entry: {e}")
+                    failures += 1
+                    continue
+            
+            # Media downloads are independent network transfers, so run them
+            # concurrently before the (serial) database writes
+            media = self._map_concurrently(
+                lambda item_data: self._cache_media(source, item_data), pending
+            )
+            
+            new_items = 0
+            
+            for item_data, cached in zip(pending, media):
+                try:
+                    if isinstance(cached, Exception):
+                        logger.error(f"Failed to download/upload media: {cached}")
+                        cached = None
+                    
                     # Create ContentItem
-                    content_item = self._create_content_item(source, item_data)
+                    content_item = self._create_content_item(source, item_data, cached)
                     new_items += 1
                     
                     logger.info(f"✓ Created: {content_item.title}")
                     
                 except Exception as e:
                     logger.warning(f"Failed to process entry: {e}")
+                    failures += 1
                     continue
             
+            # Only skip this version of the feed next time if every entry made it in
+            if validators and not failures:
+                cache.set(self._feed_validators_key(str(source.feed_url)), validators, FEED_VALIDATORS_TTL)
+            
             return new_items
             
         except Exception as e:
             logger.error(f"Failed to parse feed {source.feed_url}: {e}")
             raise
     
+    def _fetch_feed(
+        self,
+        url: str,
+        timeout: int = 30,
+        conditional: bool = True,
+    ) -> Tuple[Optional[feedparser.FeedParserDict], Dict[str, str]]:
+        """
+        Fetch a feed over the shared HTTP session and parse it.
+        
+        feedparser.parse(url) opens a fresh connection on every call; fetching
+        the bytes ourselves lets repeat hits to the same host reuse one.
+        The request is conditional on the ETag/Last-Modified remembered from
+        the previous fetch, so unchanged feeds cost a 304 and no parsing.
+        
+        Args:
+            url: Feed URL
+            timeout: Request timeout in seconds
+            conditional: Send the remembered validators (False forces a full fetch)
+            
+        Returns:
+            (parsed feed or None if not modified, validators to remember for next time)
+        """
+        headers = {'User-Agent': feedparser.USER_AGENT}
+        
+        previous = (cache.get(self._feed_validators_key(url)) or {}) if conditional else {}
+        if previous.get('etag'):
+            headers['If-None-Match'] = previous['etag']
+        if previous.get('last_modified'):
+            headers['If-Modified-Since'] = previous['last_modified']
+        
+        response = get_http_session().get(url, timeout=timeout, headers=headers)
+        
+        if response.status_code == 304:
+            return None, previous
+        
+        validators = {}
+        if response.ok:
+            if response.headers.get('ETag'):
+                validators['etag'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                validators['last_modified'] = response.headers['Last-Modified']
+        
+        # Let feedparser see the real content type/encoding and base URL
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+        response_headers.setdefault('content-location', response.url)
+        
+        return feedparser.parse(response.content, response_headers=response_headers), validators
+    
+    def _feed_validators_key(self, url: str) -> str:
+        """Cache key for a feed's ETag/Last-Modified validators."""
+        return f"etl:feed:{hashlib.md5(url.encode()).hexdigest()}"
+    
     def _ingest_youtube_channel(self, source: ContentSource) -> int:
         """
         Fetch videos from a YouTube channel/playlist/search using yt-dlp.
@@ -251,35 +390,39 @@ class ContentIngestionService:
             if cookies_file:
                 ydl_opts['cookiefile'] = cookies_file
             
-            videos = []
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                try:
+            def list_videos():
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                     result = ydl.extract_info(yt_url, download=False)
-                    
-                    if result is None:
-                        logger.warning(f"No results from yt-dlp for: {feed_url}")
-                        return 0
-                    
-                    # Handle different result types
-                    if 'entries' in result:
-                        # Playlist or search results
-                        videos = [v for v in result['entries'] if v is not None][:10]
-                    else:
-                        # Single video
-                        videos = [result]
-                        
-                except Exception as e:
-                    logger.error(f"yt-dlp extraction failed: {e}")
-                    return 0
+                
+                if result is None:
+                    return None
+                
+                # Handle different result types
+                if 'entries' in result:
+                    # Playlist or search results
+                    return [v for v in result['entries'] if v is not None][:10]
+                
+                # Single video
+                return [result]
+            
+            try:
+                videos = self._cached_fetch(f"youtube:{yt_url}", list_videos)
+            except Exception as e:
+                logger.error(f"yt-dlp extraction failed: {e}")
+                return 0
+            
+            if videos is None:
+                logger.warning(f"No results from yt-dlp for: {feed_url}")
+                return 0
             
             if not videos:
                 logger.warning(f"No videos found for: {feed_url}")
                 return 0
             
             logger.info(f"Found {len(videos)} videos for {source.name}")
-            new_items = 0
             
+            pending = []
+            seen_guids = set()
             for video in videos:
                 try:
                     if video is None:
@@ -296,8 +439,8 @@ class ContentIngestionService:
                     guid = f"youtube_{video_id}"
                     
                     # Check if already exists
-                    if ContentItem.objects.filter(guid=guid).exists():
-                        logger.debug(f"Skipping duplicate: {title}")
+                    if guid in seen_guids or ContentItem.objects.filter(guid=guid).exists():
+                        logger.debug("Skipping duplicate: %s", title)
                         continue
                     
                     # Extract metadata
@@ -306,8 +449,8 @@ class ContentIngestionService:
                     duration_seconds = video.get('duration')
                     video_url = video.get('url') or f"https://www.youtube.com/watch?v={video_id}"
                     
-                    # Create item data
-                    item_data = {
+                    seen_guids.add(guid)
+                    pending.append({
                         'title': f"{title} - {channel_name}",
                         'description': description,
                         'url': video_url,
@@ -315,35 +458,24 @@ class ContentIngestionService:
                         'published_at': timezone.now(),
                         'media_url': video_url,
                         'duration_seconds': duration_seconds,
-                    }
-                    
-                    # Download YouTube video using yt-dlp (actual download)
-                    temp_file_path = self._download_youtube_video(video_url)
-                    
-                    storage_url = None
-                    storage_provider = 'none'
+                    })
                     
-                    if temp_file_path and self.storage_service:
-                        try:
-                            # Get file extension
-                            ext = os.path.splitext(temp_file_path)[1] or '.mp4'
-                            storage_url = self.storage_service.upload_file(
-                                temp_file_path, 
-                                f"youtube/{guid}{ext}"
-                            )
-                            storage_provider = self.storage_provider
-                            logger.info(f"✓ Uploaded to {storage_provider}: {storage_url}")
-                        except Exception as e:
-                            logger.warning(f"Failed to upload to storage: {e}")
-                        finally:
-                            # Clean up temp file
-                            if os.path.exists(temp_file_path):
-                                os.unlink(temp_file_path)
-                                # Also try to remove temp directory
-                                try:
-                                    os.rmdir(os.path.dirname(temp_file_path))
-                                except:
-                                    pass
+                except Exception as e:
+                    logger.warning(f"Failed to process video: {e}")
+                    continue
+            
+            # Download YouTube videos using yt-dlp (actual download), several at a time
+            uploads = self._map_concurrently(self._cache_youtube_video, pending)
+            
+            new_items = 0
+            
+            for item_data, uploaded in zip(pending, uploads):
+                try:
+                    storage_url, storage_provider = (None, 'none')
+                    if isinstance(uploaded, Exception):
+                        logger.warning(f"Failed to download video: {uploaded}")
+                    elif uploaded:
+                        storage_url, storage_provider = uploaded
                     
                     # Create ContentItem (store YouTube URL if no S3 upload)
                     content_item = ContentItem.objects.create(
@@ -375,6 +507,37 @@ class ContentIngestionService:
             logger.error(f"Failed to fetch YouTube videos: {e}")
             raise
     
+    def _cached_fetch(self, key: str, fetch: Callable[[], any]) -> any:
+        """
+        Return fetch(), caching the result for settings.ETL_API_CACHE_TTL seconds.
+        
+        Used for listing calls (YouTube searches, NewsAPI queries) that
+        return the same answer when a source is re-ingested shortly after
+        the last run. Falsy results and exceptions are not cached.
+        
+        Args:
+            key: Cache key identifying the request (no secrets)
+            fetch: Zero-argument callable performing the request
+            
+        Returns:
+            Cached or freshly fetched result
+        """
+        ttl = getattr(settings, 'ETL_API_CACHE_TTL', 900)
+        if not ttl:
+            return fetch()
+        
+        cache_key = f"etl:api:{hashlib.md5(key.encode()).hexdigest()}"
+        result = cache.get(cache_key)
+        
+        if result is None:
+            result = fetch()
+            if result:
+                cache.set(cache_key, result, ttl)
+        else:
+            logger.debug("Cache hit: %s", key)
+        
+        return result
+    
     def _parse_feed_entry(self, entry: any, source: ContentSource) -> Dict[str, any]:
         """
         Parse a single RSS feed entry into a data dict.
@@ -423,49 +586,126 @@ class ContentIngestionService:
             'media_url': media_url,
         }
     
-    def _create_content_item(self, source: ContentSource, item_data: Dict[str, any]) -> ContentItem:
+    def _cache_media(self, source: ContentSource, item_data: Dict[str, any]) -> Optional[Tuple[str, str, int]]:
         """
-        Create a ContentItem from parsed data.
+        Download an entry's media and upload it to storage.
         
-        If source.policy == 'cache_allowed', downloads media and uploads to storage.
+        Only applies when source.policy == 'cache_allowed'. Does not touch
+        the database, so it is safe to call from worker threads.
         
         Args:
             source: ContentSource
             item_data: Parsed entry data
             
         Returns:
-            Created ContentItem
+            (storage_url, storage_provider, file_size_bytes), or None if nothing was cached
         """
-        storage_url = None
-        storage_provider = 'none'
-        file_size_bytes = None
+        if source.policy != 'cache_allowed' or not item_data['media_url']:
+            return None
         
-        # Handle media caching
-        if source.policy == 'cache_allowed' and item_data['media_url']:
-            if self.storage_service:
-                try:
-                    # Download media to temp file
-                    temp_file_path = self._download_media(item_data['media_url'])
-                    
-                    if temp_file_path:
-                        # Get file size
-                        file_size_bytes = os.path.getsize(temp_file_path)
-                        
-                        # Upload to storage
-                        object_key = self._generate_object_key(source, item_data)
-                        storage_url = self.storage_service.upload_file(temp_file_path, object_key)
-                        storage_provider = self.storage_provider
-                        
-                        # Clean up temp file
-                        os.remove(temp_file_path)
-                        
-                        logger.info(f"✓ Uploaded media to {storage_provider}: {storage_url}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to download/upload media: {e}")
-                    # Continue without storage_url
-            else:
-                logger.warning(f"Storage service not available, skipping media upload for: {item_data['title']}")
+        if not self.storage_service:
+            logger.warning(f"Storage service not available, skipping media upload for: {item_data['title']}")
+            return None
+        
+        # Download media to temp file
+        temp_file_path = self._download_media(item_data['media_url'])
+        
+        if not temp_file_path:
+            return None
+        
+        try:
+            # Get file size
+            file_size_bytes = os.path.getsize(temp_file_path)
+            
+            # Upload to storage
+            object_key = self._generate_object_key(source, item_data)
+            storage_url = self.storage_service.upload_file(temp_file_path, object_key)
+        finally:
+            # Clean up temp file
+            os.remove(temp_file_path)
+        
+        logger.info(f"✓ Uploaded media to {self.storage_provider}: {storage_url}")
+        return storage_url, self.storage_provider, file_size_bytes
+    
+    def _cache_youtube_video(self, item_data: Dict[str, any]) -> Optional[Tuple[str, str]]:
+        """
+        Download a YouTube video and upload it to storage.
+        
+        Args:
+            item_data: Parsed video data
+            
+        Returns:
+            (storage_url, storage_provider), or None if nothing was uploaded
+        """
+        # Without a storage backend there is nowhere to put the file, so don't
+        # download it at all (the item falls back to the YouTube URL)
+        if not self.storage_service:
+            return None
+        
+        temp_file_path = self._download_youtube_video(item_data['url'])
+        
+        if not temp_file_path:
+            return None
+        
+        try:
+            # Get file extension
+            ext = os.path.splitext(temp_file_path)[1] or '.mp4'
+            storage_url = self.storage_service.upload_file(
+                temp_file_path, 
+                f"youtube/{item_data['guid']}{ext}"
+            )
+            logger.info(f"✓ Uploaded to {self.storage_provider}: {storage_url}")
+            return storage_url, self.storage_provider
+        except Exception as e:
+            logger.warning(f"Failed to upload to storage: {e}")
+            return None
+        finally:
+            # Clean up temp file and its directory (unlink directly rather than
+            # stat-ing first; a missing file is just skipped)
+            try:
+                os.unlink(temp_file_path)
+                os.rmdir(os.path.dirname(temp_file_path))
+            except OSError:
+                pass
+    
+    def _map_concurrently(self, func: Callable, items: List[any]) -> List[any]:
+        """
+        Apply func to each item on a small thread pool, preserving order.
+        
+        Exceptions raised by func are returned in place of its result so
+        one failed download doesn't abort the rest of the batch.
+        """
+        if not items:
+            return []
+        
+        def call(item):
+            try:
+                return func(item)
+            except Exception as e:
+                return e
+        
+        max_workers = min(len(items), getattr(settings, 'ETL_MEDIA_WORKERS', 4))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(call, items))
+    
+    def _create_content_item(
+        self,
+        source: ContentSource,
+        item_data: Dict[str, any],
+        cached_media: Optional[Tuple[str, str, int]] = None,
+    ) -> ContentItem:
+        """
+        Create a ContentItem from parsed data.
+        
+        Args:
+            source: ContentSource
+            item_data: Parsed entry data
+            cached_media: Result of _cache_media() for this entry, if any
+            
+        Returns:
+            Created ContentItem
+        """
+        storage_url, storage_provider, file_size_bytes = cached_media or (None, 'none', None)
         
         # Create ContentItem
         content_item = ContentItem.objects.create(
@@ -507,22 +747,54 @@ class ContentIngestionService:
                 'Referer': 'https://www.google.com/',
             }
             
-            # Make request with streaming and browser headers
-            response = requests.get(url, stream=True, timeout=timeout, headers=headers)
+            # Make request with streaming and browser headers. With stream=True
+            # only the headers have been read at this point, so type/size can be
+            # rejected before any of the body is transferred (no HEAD needed).
+            response = get_http_session().get(url, stream=True, timeout=timeout, headers=headers)
             response.raise_for_status()
             
+            max_size_mb = getattr(settings, 'MAX_DOWNLOAD_SIZE_MB', 500)
+            max_size_bytes = max_size_mb * 1024 * 1024
+            
             # Determine file extension
             content_type = response.headers.get('content-type', '')
+            
+            # An HTML page here is a landing/paywall/error page, not media
+            if content_type.lower().startswith('text/html'):
+                logger.warning(f"Skipping media download, got {content_type} from {url}")
+                response.close()
+                return None
+            
+            content_length = response.headers.get('content-length')
+            if content_length and content_length.isdigit() and int(content_length) > max_size_bytes:
+                logger.warning(
+                    f"Skipping media download, {int(content_length) / (1024*1024):.1f}MB "
+                    f"exceeds limit of {max_size_mb}MB: {url}"
+                )
+                response.close()
+                return None
+            
             ext = self._get_extension_from_content_type(content_type) or self._get_extension_from_url(url)
             
             # Create temp file
+            total_size = 0
             with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as temp_file:
-                # Download in chunks
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        temp_file.write(chunk)
-                
                 temp_file_path = temp_file.name
+                try:
+                    # Download in chunks
+                    for chunk in response.iter_content(chunk_size=MEDIA_CHUNK_SIZE):
+                        if chunk:
+                            temp_file.write(chunk)
+                            total_size += len(chunk)
+                            
+                            # Servers can omit or understate Content-Length
+                            if total_size > max_size_bytes:
+                                raise ValueError(f"Download exceeded size limit of {max_size_mb}MB")
+                except BaseException:
+                    response.close()
+                    temp_file.close()
+                    os.remove(temp_file_path)  # Clean up partial file
+                    raise
             
             logger.info(f"✓ Downloaded to: {temp_file_path}")
             return temp_file_path
@@ -656,8 +928,9 @@ class ContentIngestionService:
             'application/pdf': '.pdf',
         }
         
+        content_type = content_type.lower()
         for ct, ext in content_type_map.items():
-            if ct in content_type.lower():
+            if ct in content_type:
                 return ext
         
         return None
@@ -668,7 +941,6 @@ class ContentIngestionService:
             return None
         
         # Get path from URL
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         path = parsed.path
         
@@ -706,7 +978,7 @@ class ContentIngestionService:
             api_url = f"https://meme-api.com/gimme/{subreddit}/20"
             logger.info(f"Fetching memes from: {api_url}")
             
-            response = requests.get(api_url, timeout=30)
+            response = get_http_session().get(api_url, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -724,7 +996,7 @@ class ContentIngestionService:
                 try:
                     # Skip NSFW content
                     if meme.get('nsfw', False):
-                        logger.debug(f"Skipping NSFW meme: {meme.get('title', 'Unknown')}")
+                        logger.debug("Skipping NSFW meme: %s", meme.get('title', 'Unknown'))
                         continue
                     
                     # Create GUID from post link
@@ -733,7 +1005,7 @@ class ContentIngestionService:
                     
                     # Check if already exists
                     if ContentItem.objects.filter(guid=guid).exists():
-                        logger.debug(f"Skipping duplicate meme: {meme.get('title', 'Unknown')}")
+                        logger.debug("Skipping duplicate meme: %s", meme.get('title', 'Unknown'))
                         continue
                     
                     # Get image URL
@@ -761,8 +1033,10 @@ class ContentIngestionService:
                                 logger.info(f"✓ Uploaded meme to {storage_provider}: {object_key}")
                                 
                                 # Clean up temp file
-                                if os.path.exists(temp_file_path):
+                                try:
                                     os.unlink(temp_file_path)
+                                except FileNotFoundError:
+                                    pass
                         except Exception as e:
                             logger.warning(f"Failed to upload meme to storage: {e}")
                     
@@ -811,7 +1085,7 @@ class ContentIngestionService:
                 'Accept': 'image/*,*/*',
             }
             
-            response = requests.get(url, headers=headers, timeout=30, stream=True)
+            response = get_http_session().get(url, headers=headers, timeout=30, stream=True)
             response.raise_for_status()
             
             # Get extension from URL or content type
@@ -819,7 +1093,7 @@ class ContentIngestionService:
             
             # Create temp file
             with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as temp_file:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=MEDIA_CHUNK_SIZE):
                     if chunk:
                         temp_file.write(chunk)
                 
@@ -868,17 +1142,23 @@ class ContentIngestionService:
             
             logger.info(f"Fetching news from NewsAPI for: {query}")
             
-            response = requests.get(api_url, params=params, timeout=30)
-            response.raise_for_status()
+            def fetch_articles():
+                response = get_http_session().get(api_url, params=params, timeout=30)
+                response.raise_for_status()
+                
+                data = response.json()
+                
+                if data.get('status') != 'ok':
+                    logger.error(f"NewsAPI error: {data.get('message', 'Unknown error')}")
+                    return None
+                
+                return data.get('articles', [])
             
-            data = response.json()
+            articles = self._cached_fetch(f"newsapi:{query}", fetch_articles)
             
-            if data.get('status') != 'ok':
-                logger.error(f"NewsAPI error: {data.get('message', 'Unknown error')}")
+            if articles is None:
                 return 0
             
-            articles = data.get('articles', [])
-            
             if not articles:
                 logger.warning(f"No articles found for query: {query}")
                 return 0
@@ -898,7 +1178,7 @@ class ContentIngestionService:
                     
                     # Check if already exists
                     if ContentItem.objects.filter(guid=guid).exists():
-                        logger.debug(f"Skipping duplicate article: {article.get('title', 'Unknown')[:50]}")
+                        logger.debug("Skipping duplicate article: %.50s", article.get('title', 'Unknown'))
                         continue
                     
                     # Get image URL
@@ -920,8 +1200,10 @@ class ContentIngestionService:
                                 logger.info(f"✓ Uploaded news image to {storage_provider}: {object_key}")
                                 
                                 # Clean up temp file
-                                if os.path.exists(temp_file_path):
+                                try:
                                     os.unlink(temp_file_path)
+                                except FileNotFoundError:
+                                    pass
                         except Exception as e:
                             logger.warning(f"Failed to upload news image: {e}")
                     
@@ -11,7 +11,7 @@ from typing import List, Optional
 from datetime import datetime
 
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db.models import Count, Q
 
 from core.models import (
     UserPreference,
@@ -121,24 +121,28 @@ class DjangoMCPService:
             List of SubscriptionSchema objects
         """
         try:
+            # Project straight to the schema's fields (source name via the
+            # join) instead of hydrating Subscription and ContentSource rows
             subscriptions = Subscription.objects.filter(
                 user_id=user_id,
                 is_active=True,
-            ).select_related('source')
-            
-            results = []
-            for sub in subscriptions:
-                results.append(SubscriptionSchema(
-                    id=sub.id,
-                    user_id=sub.user_id,
-                    source_id=sub.source_id,
-                    source_name=sub.source.name,
-                    priority=sub.priority,
-                    is_active=sub.is_active,
-                    created_at=sub.created_at,
-                ))
+            ).values(
+                'id', 'user_id', 'source_id', 'source__name',
+                'priority', 'is_active', 'created_at',
+            )
             
-            return results
+            return [
+                SubscriptionSchema(
+                    id=sub['id'],
+                    user_id=sub['user_id'],
+                    source_id=sub['source_id'],
+                    source_name=sub['source__name'],
+                    priority=sub['priority'],
+                    is_active=sub['is_active'],
+                    created_at=sub['created_at'],
+                )
+                for sub in subscriptions
+            ]
         except Exception as e:
             logger.error(f"Error fetching subscriptions for user {user_id}: {e}")
             return []
@@ -220,11 +224,13 @@ class DjangoMCPService:
         try:
             item = DownloadItem.objects.get(id=item_id)
             item.status = status
+            update_fields = ['status', 'updated_at']
             
             if media_url:
                 item.media_url = media_url
+                update_fields.append('media_url')
             
-            item.save()
+            item.save(update_fields=update_fields)
             logger.info(f"Updated download item {item_id} to status {status}")
             return True
         except DownloadItem.DoesNotExist:
@@ -257,27 +263,76 @@ class DjangoMCPService:
             if status:
                 queryset = queryset.filter(status=status)
             
-            results = []
-            for item in queryset:
-                results.append(DownloadItemSchema(
-                    id=item.id,
-                    user_id=item.user_id,
-                    source_id=item.source_id,
-                    source_name=item.source.name,
-                    title=item.title,
-                    original_url=str(item.original_url),
-                    media_url=str(item.media_url) if item.media_url else None,
-                    status=item.status,
-                    available_from=item.available_from,
-                    created_at=item.created_at,
-                    updated_at=item.updated_at,
-                ))
-            
-            return results
+            return [
+                DjangoMCPService._download_item_schema(item)
+                for item in queryset
+            ]
         except Exception as e:
             logger.error(f"Error fetching download items for user {user_id}: {e}")
             return []
     
+    @staticmethod
+    def get_download_item(item_id: int) -> Optional[DownloadItemSchema]:
+        """
+        Get a single download item by ID.
+        
+        Args:
+            item_id: The download item ID
+            
+        Returns:
+            DownloadItemSchema if found, None otherwise
+        """
+        try:
+            item = DownloadItem.objects.select_related('source').get(id=item_id)
+            return DjangoMCPService._download_item_schema(item)
+        except DownloadItem.DoesNotExist:
+            return None
+        except Exception as e:
+            logger.error(f"Error fetching download item {item_id}: {e}")
+            return None
+    
+    @staticmethod
+    def get_download_status_counts(user_id: int) -> dict:
+        """
+        Count a user's download items per status.
+        
+        The grouping is done by the database, so only one row per status
+        comes back regardless of how many downloads the user has.
+        
+        Args:
+            user_id: The user's ID
+            
+        Returns:
+            Dict mapping status to item count (statuses with no items are omitted)
+        """
+        try:
+            return dict(
+                DownloadItem.objects.filter(user_id=user_id)
+                .order_by()
+                .values_list('status')
+                .annotate(n=Count('id'))
+            )
+        except Exception as e:
+            logger.error(f"Error counting download items for user {user_id}: {e}")
+            return {}
+    
+    @staticmethod
+    def _download_item_schema(item: DownloadItem) -> DownloadItemSchema:
+        """Convert a DownloadItem (with source loaded) to its schema."""
+        return DownloadItemSchema(
+            id=item.id,
+            user_id=item.user_id,
+            source_id=item.source_id,
+            source_name=item.source.name,
+            title=item.title,
+            original_url=str(item.original_url),
+            media_url=str(item.media_url) if item.media_url else None,
+            status=item.status,
+            available_from=item.available_from,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+        )
+    
     @staticmethod
     def get_user_commute_windows(user_id: int) -> List[CommuteWindowSchema]:
         """
@@ -0,0 +1,56 @@
+"""
+Shared HTTP session.
+
+Outbound HTTP calls (RSS feeds, media files, third-party APIs) go through
+one pooled requests.Session per process, so repeat requests to the same
+host reuse keep-alive connections instead of paying for a new TCP/TLS
+handshake every time.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Large enough for the ETL thread pools (sources x media workers)
+POOL_MAXSIZE = 16
+
+# Transient gateway errors are retried a couple of times before callers see
+# them (urllib3 only retries idempotent methods such as GET by default). Once
+# retries run out the last response is returned as-is rather than raised as
+# a RetryError, so callers handle it like any other error status
+RETRY = Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+)
+
+# Keyed by whether the adapter retries
+_sessions = {}
+
+
+def get_http_session(retry: bool = True) -> requests.Session:
+    """
+    Return the process-wide requests.Session.
+
+    The session is created on first use. requests.Session is safe to share
+    between threads for plain GETs as long as callers don't mutate its
+    headers/cookies; pass per-request headers instead.
+
+    Pass retry=False for callers that already retry at a higher level (e.g.
+    a Celery task with self.retry), so failures aren't retried twice over.
+    """
+    session = _sessions.get(retry)
+
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_MAXSIZE,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=RETRY if retry else 0,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session = _sessions.setdefault(retry, session)
+
+    return session
@@ -5,6 +5,7 @@ This is the ONLY module that directly imports the ollama library.
 It provides a centralized interface for LLM interactions used by tools.
 """
 
+import json
 import logging
 from typing import List, Dict, Optional
 
@@ -180,7 +181,6 @@ class OllamaClient:
             )
             
             # Try to parse JSON response
-            import json
             result = json.loads(response)
             return result
         
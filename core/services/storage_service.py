@@ -14,6 +14,10 @@ from datetime import timedelta
 
 logger = logging.getLogger(__name__)
 
+# Uploads run from the ETL thread pools (sources x media workers), so give
+# the S3 client enough pooled connections that workers don't queue for one
+S3_MAX_POOL_CONNECTIONS = 16
+
 
 class StorageService(ABC):
     """Abstract base class for storage providers."""
@@ -68,18 +72,36 @@ class S3StorageService(StorageService):
         """
         try:
             import boto3
+            from boto3.s3.transfer import TransferConfig
+            from botocore.config import Config
             from botocore.exceptions import ClientError
             
             self.bucket_name = bucket_name
             self.region = region
             self.ClientError = ClientError
             
-            # Initialize S3 client
+            # Initialize S3 client; one client (and its keep-alive connection
+            # pool) is shared by every upload this service makes
             self.s3_client = boto3.client(
                 's3',
                 aws_access_key_id=aws_access_key_id,
                 aws_secret_access_key=aws_secret_access_key,
                 region_name=region,
+                config=Config(
+                    signature_version='s3v4',
+                    retries={'max_attempts': 3, 'mode': 'standard'},
+                    tcp_keepalive=True,
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                ),
+            )
+            
+            # Media files above 8 MB go up as parallel multipart uploads; keep
+            # per-file concurrency modest since several files upload at once
+            self.transfer_config = TransferConfig(
+                multipart_threshold=8 * 1024 * 1024,
+                multipart_chunksize=8 * 1024 * 1024,
+                max_concurrency=4,
+                use_threads=True,
             )
             
             logger.info(f"Initialized S3StorageService for bucket: {bucket_name}")
@@ -105,7 +127,8 @@ class S3StorageService(StorageService):
                 file_path,
                 self.bucket_name,
                 object_key,
-                ExtraArgs={'ContentType': self._guess_content_type(file_path)}
+                ExtraArgs={'ContentType': self._guess_content_type(file_path)},
+                Config=self.transfer_config,
             )
             
             # Generate public URL
@@ -206,19 +229,17 @@ class SupabaseStorageService(StorageService):
             Public URL to the uploaded file
         """
         try:
-            # Read file
+            # Upload to Supabase, passing the open file so the client streams
+            # it in chunks instead of holding the whole file in memory
             with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
-            # Upload to Supabase
-            response = self.supabase.storage.from_(self.bucket_name).upload(
-                path=object_key,
-                file=file_data,
-                file_options={
-                    "content-type": self._guess_content_type(file_path),
-                    "upsert": "true",  # Overwrite if exists
-                }
-            )
+                response = self.supabase.storage.from_(self.bucket_name).upload(
+                    path=object_key,
+                    file=f,
+                    file_options={
+                        "content-type": self._guess_content_type(file_path),
+                        "upsert": "true",  # Overwrite if exists
+                    }
+                )
             
             # Generate public URL
             url = self.supabase.storage.from_(self.bucket_name).get_public_url(object_key)
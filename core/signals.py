@@ -35,7 +35,42 @@ def create_user_preference(sender, instance, created, **kwargs):
                 max_daily_items=10,
                 max_storage_mb=500
             )
-            logger.info(f"Created default preferences for user: {instance.username}")
+            logger.info("Created default preferences for user: %s", instance.username)
+
+
+def dispatch_downloads(download_item_ids):
+    """
+    Start the Celery download task for each queued DownloadItem.
+    
+    Shared by the post_save signal below and by callers that insert with
+    bulk_create (which doesn't send post_save). Does nothing when
+    AUTO_PROCESS_DOWNLOADS=False. Returns the number of tasks dispatched.
+    """
+    # Check if auto-processing is enabled (default: True)
+    if not getattr(settings, 'AUTO_PROCESS_DOWNLOADS', True):
+        logger.debug("Auto-processing disabled for DownloadItems %s", download_item_ids)
+        return 0
+    
+    from core.tasks import download_content_file
+    
+    dispatched = 0
+    for download_item_id in download_item_ids:
+        try:
+            # Trigger Celery task for this download item
+            task = download_content_file.delay(download_item_id)
+            dispatched += 1
+            logger.info(
+                "Auto-processed download queue: DownloadItem %s → Celery task %s",
+                download_item_id, task.id,
+            )
+        except Exception as e:
+            logger.error(
+                "Error auto-processing download queue for DownloadItem %s: %s",
+                download_item_id, e,
+                exc_info=True
+            )
+    
+    return dispatched
 
 
 @receiver(post_save, sender=DownloadItem)
@@ -52,26 +87,4 @@ def auto_process_download_queue(sender, instance, created, **kwargs):
     if not created or instance.status != 'queued':
         return
     
-    # Check if auto-processing is enabled (default: True)
-    auto_process = getattr(settings, 'AUTO_PROCESS_DOWNLOADS', True)
-    if not auto_process:
-        logger.debug(f"Auto-processing disabled for DownloadItem {instance.id}")
-        return
-    
-    try:
-        from core.tasks import download_content_file
-        
-        # Trigger Celery task for this download item
-        task = download_content_file.delay(instance.id)
-        
-        logger.info(
-            f"Auto-processed download queue: "
-            f"DownloadItem {instance.id} → Celery task {task.id}"
-        )
-        
-    except Exception as e:
-        logger.error(
-            f"Error auto-processing download queue for DownloadItem {instance.id}: {e}",
-            exc_info=True
-        )
-
+    dispatch_downloads([instance.id])
@@ -1,21 +1,60 @@
 from celery import shared_task
 from django.utils import timezone
 from django.conf import settings
+from django.db import transaction
 from datetime import timedelta
 import logging
 import requests
 import os
 from pathlib import Path
 import re
+from urllib.parse import urlparse
 
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 
 from core.models import ContentSource, ContentItem, DownloadItem
-from core.services.content_ingestion import ContentIngestionService
+from core.services.http_session import get_http_session
 
 logger = logging.getLogger(__name__)
 
+# Streaming read size for media downloads; large files are hundreds of MB,
+# so bigger chunks mean far fewer Python-level loop iterations
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Rows deleted per statement by the cleanup task
+CLEANUP_BATCH_SIZE = 5000
+
+# Hosts our ETL pipeline uploads cached media to (S3 buckets, Supabase projects)
+CACHED_STORAGE_HOST_SUFFIXES = ('.amazonaws.com', '.supabase.co')
+
+# Filename sanitizing for downloaded files
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\s-]')
+FILENAME_SEPARATORS_RE = re.compile(r'[-\s]+')
+
+
+def is_cached_storage_url(url: str) -> bool:
+    """Return True if url points at our S3/Supabase media cache."""
+    host = urlparse(url).hostname or ''  # hostname is already lowercased
+    return host.endswith(CACHED_STORAGE_HOST_SUFFIXES)
+
+
+def _mark_download_failed(download_item_id: int, error_msg: str):
+    """
+    Record a failed download with a single UPDATE.
+    
+    Used from the task's error handlers, where the in-memory instance may be
+    missing or stale, so nothing is read back from the database first.
+    """
+    try:
+        DownloadItem.objects.filter(id=download_item_id).update(
+            status='failed',
+            error_message=error_msg,
+            updated_at=timezone.now(),
+        )
+    except Exception:
+        logger.exception("Could not mark DownloadItem %s as failed", download_item_id)
+
 
 def notify_download_ready(download_item, file_size: int):
     """
@@ -45,10 +84,10 @@ def notify_download_ready(download_item, file_size: int):
                 'file_size': file_size,
             }
         )
-        logger.info(f"WebSocket notification sent for DownloadItem {download_item.id}")
+        logger.info("WebSocket notification sent for DownloadItem %s", download_item.id)
     except Exception as e:
         # Don't fail the download if notification fails
-        logger.warning(f"Failed to send WebSocket notification: {e}")
+        logger.warning("Failed to send WebSocket notification: %s", e)
 
 
 @shared_task
@@ -68,15 +107,19 @@ def ingest_content_sources():
     """
     logger.info("Starting scheduled content ingestion...")
     
+    # Imported here so web processes that only enqueue tasks (views import
+    # this module for .delay) don't load feedparser and the storage clients
+    from core.services.content_ingestion import ContentIngestionService
+    
     try:
         service = ContentIngestionService()
         results = service.ingest_all_sources()
         
-        logger.info(f"ETL complete: {results}")
+        logger.info("ETL complete: %s", results)
         return results
         
     except Exception as e:
-        logger.error(f"ETL task failed: {e}")
+        logger.error("ETL task failed: %s", e)
         return {'error': str(e)}
 
 
@@ -96,7 +139,9 @@ def manual_ingest_source(source_id: int):
     Returns:
         dict: Summary with source name and items added
     """
-    logger.info(f"Manual ingestion triggered for source ID: {source_id}")
+    logger.info("Manual ingestion triggered for source ID: %s", source_id)
+    
+    from core.services.content_ingestion import ContentIngestionService
     
     try:
         source = ContentSource.objects.get(id=source_id)
@@ -109,7 +154,7 @@ def manual_ingest_source(source_id: int):
             'items_added': count,
         }
         
-        logger.info(f"Manual ingestion complete: {result}")
+        logger.info("Manual ingestion complete: %s", result)
         return result
         
     except ContentSource.DoesNotExist:
@@ -118,7 +163,7 @@ def manual_ingest_source(source_id: int):
         return {'error': error_msg}
         
     except Exception as e:
-        logger.error(f"Manual ingestion failed: {e}")
+        logger.error("Manual ingestion failed: %s", e)
         return {'error': str(e)}
 
 
@@ -137,22 +182,22 @@ def cleanup_old_content(days: int = 30):
     Returns:
         dict: Summary of cleanup operation
     """
-    logger.info(f"Starting content cleanup (older than {days} days)...")
+    logger.info("Starting content cleanup (older than %s days)...", days)
     
     try:
         cutoff_date = timezone.now() - timedelta(days=days)
         
         # Clean up old ContentItems
-        content_items_deleted = ContentItem.objects.filter(
+        content_items_deleted = _delete_in_batches(ContentItem.objects.filter(
             discovered_at__lt=cutoff_date
-        ).delete()[0]
+        ))
         
         # Clean up old DownloadItems (except ready ones users might still use)
-        download_items_deleted = DownloadItem.objects.filter(
+        download_items_deleted = _delete_in_batches(DownloadItem.objects.filter(
             created_at__lt=cutoff_date
         ).exclude(
             status='ready'
-        ).delete()[0]
+        ))
         
         result = {
             'cutoff_date': cutoff_date.isoformat(),
@@ -160,34 +205,63 @@ def cleanup_old_content(days: int = 30):
             'download_items_deleted': download_items_deleted,
         }
         
-        logger.info(f"Cleanup complete: {result}")
+        logger.info("Cleanup complete: %s", result)
         return result
         
     except Exception as e:
-        logger.error(f"Cleanup task failed: {e}")
+        logger.error("Cleanup task failed: %s", e)
         return {'error': str(e)}
 
 
-@shared_task
-def download_content_file(download_item_id: int):
+def _delete_in_batches(queryset, batch_size: int = CLEANUP_BATCH_SIZE) -> int:
+    """
+    Delete the rows matched by queryset in fixed-size batches.
+    
+    A single queryset.delete() collects every matching row (and its
+    cascades) in memory and holds the locks for the whole run; batching
+    by primary key keeps both bounded.
+    
+    Returns:
+        Total number of objects deleted, including cascades
+    """
+    model = queryset.model
+    deleted = 0
+    
+    while True:
+        ids = list(queryset.order_by().values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        
+        with transaction.atomic():
+            deleted += model.objects.filter(pk__in=ids).delete()[0]
+    
+    return deleted
+
+
+@shared_task(bind=True, max_retries=3)
+def download_content_file(self, download_item_id: int):
     """
     Download a content file from S3/Supabase to local storage.
     
     This Celery task downloads media files from remote storage (S3/Supabase)
     to the local file system for offline access.
     
+    Transient network failures (connection errors, timeouts) are retried
+    with exponential backoff before the item is marked as failed.
+    
     Args:
         download_item_id: ID of the DownloadItem to download
         
     Returns:
         dict: Status dictionary with 'status', 'file_path', or 'error'
     """
-    logger.info(f"Starting download for DownloadItem ID: {download_item_id}")
+    logger.info("Starting download for DownloadItem ID: %s", download_item_id)
     
     try:
         # Get DownloadItem
         try:
-            download_item = DownloadItem.objects.select_related('user', 'source').get(id=download_item_id)
+            # Only the source is read (for the ready notification); user_id is a column
+            download_item = DownloadItem.objects.select_related('source').get(id=download_item_id)
         except DownloadItem.DoesNotExist:
             error_msg = f"DownloadItem {download_item_id} not found"
             logger.error(error_msg)
@@ -199,26 +273,27 @@ def download_content_file(download_item_id: int):
                 "No media URL available for download. "
                 "Content was not cached in storage during ETL pipeline."
             )
-            logger.error(f"{error_msg} for DownloadItem {download_item_id}")
+            logger.error("%s for DownloadItem %s", error_msg, download_item_id)
             download_item.status = 'failed'
             download_item.error_message = error_msg
-            download_item.save()
+            download_item.save(update_fields=['status', 'error_message', 'updated_at'])
             return {'status': 'failed', 'error': error_msg}
         
         # Log whether we're downloading from storage or original source
-        if 's3.amazonaws.com' in download_item.media_url or 'supabase' in download_item.media_url:
-            logger.info(f"✓ Downloading from cached storage: {download_item.media_url[:100]}...")
+        if is_cached_storage_url(download_item.media_url):
+            logger.info("✓ Downloading from cached storage: %.100s...", download_item.media_url)
         else:
             logger.warning(
-                f"⚠️  Downloading from ORIGINAL source (not cached): {download_item.media_url[:100]}...\n"
-                f"   This may fail if the source blocks downloads (403 Forbidden).\n"
-                f"   Ideally, content should be cached in S3/Supabase during ETL."
+                "⚠️  Downloading from ORIGINAL source (not cached): %.100s...\n"
+                "   This may fail if the source blocks downloads (403 Forbidden).\n"
+                "   Ideally, content should be cached in S3/Supabase during ETL.",
+                download_item.media_url,
             )
         
         # Update status to downloading
         download_item.status = 'downloading'
-        download_item.save()
-        logger.info(f"Status updated to 'downloading' for DownloadItem {download_item_id}")
+        download_item.save(update_fields=['status', 'updated_at'])
+        logger.info("Status updated to 'downloading' for DownloadItem %s", download_item_id)
         
         # Create download directory
         download_dir = getattr(settings, 'DOWNLOAD_DIR', settings.MEDIA_ROOT / 'downloads')
@@ -227,8 +302,8 @@ def download_content_file(download_item_id: int):
         
         # Generate safe filename
         # Clean title and add timestamp to avoid collisions
-        safe_title = re.sub(r'[^\w\s-]', '', download_item.title)
-        safe_title = re.sub(r'[-\s]+', '_', safe_title)[:100]  # Limit length
+        safe_title = UNSAFE_FILENAME_CHARS_RE.sub('', download_item.title)
+        safe_title = FILENAME_SEPARATORS_RE.sub('_', safe_title)[:100]  # Limit length
         timestamp = timezone.now().strftime('%Y%m%d_%H%M%S')
         
         # Get file extension from URL or default to .mp3
@@ -242,7 +317,8 @@ def download_content_file(download_item_id: int):
         max_size_mb = getattr(settings, 'MAX_DOWNLOAD_SIZE_MB', 500)
         max_size_bytes = max_size_mb * 1024 * 1024
         
-        response = requests.get(download_item.media_url, stream=True, timeout=30)
+        # No adapter retries: transient failures are retried by this task itself
+        response = get_http_session(retry=False).get(download_item.media_url, stream=True, timeout=30)
         response.raise_for_status()
         
         # Check content length
@@ -252,37 +328,51 @@ def download_content_file(download_item_id: int):
             logger.error(error_msg)
             download_item.status = 'failed'
             download_item.error_message = error_msg
-            download_item.save()
+            download_item.save(update_fields=['status', 'error_message', 'updated_at'])
             return {'status': 'failed', 'error': error_msg}
         
-        # Download in chunks
-        chunk_size = 8192
+        # Download in chunks into a sibling .part file and move it into place
+        # once complete: same directory, so os.replace is a rename, not a copy,
+        # and the final path never holds a partial file
         total_size = 0
+        part_path = file_path.with_name(f"{filename}.part")
+        
+        try:
+            with open(part_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        total_size += len(chunk)
+                        
+                        # Check size limit during download
+                        if total_size > max_size_bytes:
+                            break
+        except BaseException:
+            part_path.unlink(missing_ok=True)  # Clean up partial file
+            raise
+        
+        if total_size > max_size_bytes:
+            error_msg = f"Download exceeded size limit of {max_size_mb}MB"
+            logger.error(error_msg)
+            part_path.unlink(missing_ok=True)  # Clean up partial file
+            download_item.status = 'failed'
+            download_item.error_message = error_msg
+            download_item.save(update_fields=['status', 'error_message', 'updated_at'])
+            return {'status': 'failed', 'error': error_msg}
         
-        with open(file_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    total_size += len(chunk)
-                    
-                    # Check size limit during download
-                    if total_size > max_size_bytes:
-                        error_msg = f"Download exceeded size limit of {max_size_mb}MB"
-                        logger.error(error_msg)
-                        os.remove(file_path)  # Clean up partial file
-                        download_item.status = 'failed'
-                        download_item.error_message = error_msg
-                        download_item.save()
-                        return {'status': 'failed', 'error': error_msg}
+        os.replace(part_path, file_path)
         
         # Update DownloadItem with success
         download_item.status = 'ready'
         download_item.local_file_path = str(file_path)
         download_item.file_size_bytes = total_size
         download_item.error_message = None
-        download_item.save()
+        download_item.save(update_fields=['status', 'local_file_path', 'file_size_bytes', 'error_message', 'updated_at'])
         
-        logger.info(f"Download complete for DownloadItem {download_item_id}: {file_path} ({total_size / (1024*1024):.2f}MB)")
+        logger.info(
+            "Download complete for DownloadItem %s: %s (%.2fMB)",
+            download_item_id, file_path, total_size / (1024*1024),
+        )
         
         # Send WebSocket notification to trigger auto-download on frontend
         notify_download_ready(download_item, total_size)
@@ -294,26 +384,28 @@ def download_content_file(download_item_id: int):
             'download_item_id': download_item_id,
         }
         
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+        if self.request.retries < self.max_retries:
+            countdown = 10 * 2 ** self.request.retries
+            logger.warning(
+                "Transient download error for DownloadItem %s: %s (retrying in %ss)",
+                download_item_id, e, countdown,
+            )
+            raise self.retry(exc=e, countdown=countdown)
+        
+        error_msg = f"Download failed: {str(e)}"
+        logger.error("%s for DownloadItem %s", error_msg, download_item_id)
+        _mark_download_failed(download_item_id, error_msg)
+        return {'status': 'failed', 'error': error_msg}
+        
     except requests.exceptions.RequestException as e:
         error_msg = f"Download failed: {str(e)}"
-        logger.error(f"{error_msg} for DownloadItem {download_item_id}")
-        try:
-            download_item = DownloadItem.objects.get(id=download_item_id)
-            download_item.status = 'failed'
-            download_item.error_message = error_msg
-            download_item.save()
-        except:
-            pass
+        logger.error("%s for DownloadItem %s", error_msg, download_item_id)
+        _mark_download_failed(download_item_id, error_msg)
         return {'status': 'failed', 'error': error_msg}
         
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"{error_msg} for DownloadItem {download_item_id}", exc_info=True)
-        try:
-            download_item = DownloadItem.objects.get(id=download_item_id)
-            download_item.status = 'failed'
-            download_item.error_message = error_msg
-            download_item.save()
-        except:
-            pass
+        logger.error("%s for DownloadItem %s", error_msg, download_item_id, exc_info=True)
+        _mark_download_failed(download_item_id, error_msg)
         return {'status': 'failed', 'error': error_msg}
\ No newline at end of file
@@ -0,0 +1,36 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import ContentItem, ContentSource, DownloadItem
+from core.tools import queue_downloads
+
+
+@override_settings(AUTO_PROCESS_DOWNLOADS=False)
+class QueueDownloadsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='listener', password='pw')
+        self.source = ContentSource.objects.create(
+            name='Tech Pod', type='podcast', feed_url='https://example.com/feed.xml'
+        )
+
+    def create_cached_item(self, title, slug):
+        return ContentItem.objects.create(
+            source=self.source,
+            title=title,
+            guid=slug,
+            url=f'https://example.com/{slug}',
+            storage_url=f'https://cdn.example.com/{slug}.mp3',
+            published_at=timezone.now(),
+        )
+
+    def test_same_title_in_one_batch_is_queued_once(self):
+        first = self.create_cached_item('same', 'ep-1')
+        second = self.create_cached_item('same', 'ep-2')
+
+        result = queue_downloads(self.user.id, [first.id, second.id])
+
+        download = DownloadItem.objects.get(user=self.user)
+        self.assertNotIn('ID: None', result)
+        self.assertIn(f'same (Download Item ID: {download.id})', result)
+        self.assertIn('same: duplicate of an item queued in this request', result)
@@ -16,6 +16,7 @@ from .content_recommendation import (
 )
 from .content_download import (
     queue_download,
+    queue_downloads,
     check_download_status,
     process_download_queue,
 )
@@ -34,6 +35,7 @@ __all__ = [
     "get_content_item_details",
     # Download tools
     "queue_download",
+    "queue_downloads",
     "check_download_status",
     "process_download_queue",
     # LLM tools
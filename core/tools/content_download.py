@@ -6,7 +6,7 @@ These tools handle queuing, tracking, and processing content downloads.
 
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 
 from core.services.django_mcp import DjangoMCPService
 
@@ -48,7 +48,10 @@ def queue_download(
         
         # Fetch the ContentItem
         try:
-            content_item = ContentItem.objects.select_related('source').get(id=content_item_id)
+            content_item = ContentItem.objects.select_related('source').only(
+                'id', 'title', 'description', 'url', 'media_url',
+                'storage_url', 'storage_provider', 'file_size_bytes', 'source__name',
+            ).get(id=content_item_id)
         except ContentItem.DoesNotExist:
             return f"Error: Content item #{content_item_id} not found. Please check the Content ID."
         
@@ -67,11 +70,11 @@ def queue_download(
         # Match by source + title to avoid false duplicates
         existing = DownloadItem.objects.filter(
             user_id=user_id,
-            source=content_item.source,
+            source_id=content_item.source_id,
             title=content_item.title,
         ).exclude(
             status='failed'  # Allow retrying failed downloads
-        ).first()
+        ).only('id', 'title', 'status', 'media_url').first()
         
         if existing:
             return (
@@ -130,6 +133,132 @@ def queue_download(
         logger.error(f"Error queuing download: {e}")
         return f"Error queuing download: {str(e)}"
 
+def queue_downloads(
+    user_id: int,
+    content_item_ids: List[int],
+) -> str:
+    """
+    Queue several content items for download in one call.
+    
+    Batch version of queue_download: the ContentItems are fetched in one
+    query, duplicates are checked in one query and the new DownloadItems
+    are inserted with a single bulk INSERT, so the agent makes one tool
+    call for a whole list of recommendations.
+    
+    Args:
+        user_id: The user's ID.
+        content_item_ids: IDs of the ContentItems to download (from recommendations).
+        
+    Returns:
+        A summary listing the queued, already-queued and skipped items.
+        
+    Example:
+        >>> queue_downloads(1, [42, 43, 44])
+        "✓ Queued 2 of 3 item(s)
+        
+        Queued:
+        - How AI is Changing Everything (Download Item ID: 123)
+        - Tech News Episode 42 (Download Item ID: 124)
+        
+        Already in queue:
+        - TED Talk: Future of AI (Download Item ID: 98, status: ready)"
+    """
+    try:
+        from django.utils import timezone
+        from core.models import ContentItem, DownloadItem
+        from core.signals import dispatch_downloads
+        
+        # Keep the caller's order but drop repeated IDs
+        content_item_ids = list(dict.fromkeys(content_item_ids))
+        
+        content_items = ContentItem.objects.select_related('source').only(
+            'id', 'title', 'description', 'url', 'media_url',
+            'storage_url', 'source__name',
+        ).in_bulk(content_item_ids)
+        
+        # Same duplicate rule as queue_download (source + title, failed
+        # downloads may be retried), checked for the whole batch at once
+        existing = {
+            (item.source_id, item.title): item
+            for item in DownloadItem.objects.filter(
+                user_id=user_id,
+                source_id__in={item.source_id for item in content_items.values()},
+                title__in={item.title for item in content_items.values()},
+            ).exclude(status='failed').only('id', 'source_id', 'title', 'status')
+        }
+        
+        now = timezone.now()
+        seen_in_batch = set()
+        to_create = []
+        already_queued = []
+        skipped = []
+        
+        for content_item_id in content_item_ids:
+            content_item = content_items.get(content_item_id)
+            
+            if content_item is None:
+                skipped.append(f"- Content ID {content_item_id}: not found")
+                continue
+            
+            if not content_item.storage_url:
+                skipped.append(f"- {content_item.title}: not cached in storage (S3/Supabase)")
+                continue
+            
+            key = (content_item.source_id, content_item.title)
+            if key in existing:
+                item = existing[key]
+                already_queued.append(
+                    f"- {item.title} (Download Item ID: {item.id}, status: {item.status})"
+                )
+                continue
+            
+            if key in seen_in_batch:
+                skipped.append(
+                    f"- {content_item.title}: duplicate of an item queued in this request"
+                )
+                continue
+            
+            download_item = DownloadItem(
+                user_id=user_id,
+                source_id=content_item.source_id,
+                title=content_item.title,
+                description=content_item.description,
+                original_url=content_item.url,
+                media_url=content_item.storage_url,
+                status='queued',
+                available_from=now,
+            )
+            seen_in_batch.add(key)
+            to_create.append(download_item)
+        
+        created = DownloadItem.objects.bulk_create(to_create)
+        
+        # bulk_create doesn't send post_save, so start the downloads the
+        # auto_process_download_queue signal would otherwise have started
+        if created:
+            dispatch_downloads([download_item.id for download_item in created])
+        
+        lines = [f"✓ Queued {len(created)} of {len(content_item_ids)} item(s)\n"]
+        
+        if created:
+            lines.append("\nQueued:\n")
+            lines.extend(
+                f"- {item.title} (Download Item ID: {item.id})\n" for item in created
+            )
+        
+        if already_queued:
+            lines.append("\nAlready in queue:\n")
+            lines.extend(f"{line}\n" for line in already_queued)
+        
+        if skipped:
+            lines.append("\nSkipped:\n")
+            lines.extend(f"{line}\n" for line in skipped)
+        
+        return ''.join(lines)
+    
+    except Exception as e:
+        logger.error(f"Error queuing downloads: {e}")
+        return f"Error queuing downloads: {str(e)}"
 
 def check_download_status(item_id: int) -> str:
     """
@@ -153,16 +282,7 @@ def check_download_status(item_id: int) -> str:
     """
     try:
         mcp = DjangoMCPService()
-        
-        # Get all items and filter (inefficient but works for now)
-        # In production, would add get_download_item_by_id to MCP service
-        items = mcp.get_download_items(user_id=1)  # TODO: Better filtering
-        
-        item = None
-        for i in items:
-            if i.id == item_id:
-                item = i
-                break
+        item = mcp.get_download_item(item_id)
         
         if not item:
             return f"Download item #{item_id} not found."
@@ -222,27 +342,35 @@ def process_download_queue(user_id: int) -> str:
         from core.models import DownloadItem
         from core.tasks import download_content_file
         
-        # Get all queued items
+        # Stream queued items in chunks; only id/title are needed here
         queued_items = DownloadItem.objects.filter(
             user_id=user_id,
             status='queued'
-        ).select_related('source')
-        
-        if not queued_items:
-            return f"No queued downloads found for user {user_id}."
-        
-        result = (
-            f"Processing download queue for user {user_id}...\n"
-            f"Found {len(queued_items)} queued item(s):\n\n"
-        )
+        ).only('id', 'title').iterator(chunk_size=500)
         
         # Trigger Celery tasks for each queued item
+        lines = []
         task_ids = []
+        item_ids = []
         for item in queued_items:
-            result += f"- {item.title} (Download Item ID: {item.id})\n"
+            lines.append(f"- {item.title} (Download Item ID: {item.id})\n")
             task = download_content_file.delay(item.id)
             task_ids.append(task.id)
-            logger.info(f"Triggered download task {task.id} for DownloadItem {item.id}")
+            item_ids.append(item.id)
+        
+        if not task_ids:
+            return f"No queued downloads found for user {user_id}."
+        
+        # One log record for the whole batch rather than one per item
+        logger.info(
+            "Triggered %d download task(s) for DownloadItems %s",
+            len(task_ids), item_ids,
+        )
+        
+        result = (
+            f"Processing download queue for user {user_id}...\n"
+            f"Found {len(task_ids)} queued item(s):\n\n"
+        ) + ''.join(lines)
         
         result += (
             f"\n✓ Started {len(task_ids)} background download task(s)\n\n"
@@ -288,31 +416,19 @@ def get_user_download_summary(user_id: int) -> str:
     try:
         mcp = DjangoMCPService()
         
-        # Get all items
-        all_items = mcp.get_download_items(user_id=user_id)
+        # Count by status in the database instead of loading every item
+        status_counts = mcp.get_download_status_counts(user_id)
         
-        if not all_items:
+        if not status_counts:
             return f"No downloads found for user {user_id}."
         
-        # Count by status
-        status_counts = {
-            'queued': 0,
-            'downloading': 0,
-            'ready': 0,
-            'failed': 0,
-        }
-        
-        for item in all_items:
-            if item.status in status_counts:
-                status_counts[item.status] += 1
-        
         result = (
             f"Download Summary for User {user_id}:\n\n"
-            f"Queued: {status_counts['queued']} item(s)\n"
-            f"Downloading: {status_counts['downloading']} item(s)\n"
-            f"Ready: {status_counts['ready']} item(s)\n"
-            f"Failed: {status_counts['failed']} item(s)\n\n"
-            f"Total: {len(all_items)} item(s)"
+            f"Queued: {status_counts.get('queued', 0)} item(s)\n"
+            f"Downloading: {status_counts.get('downloading', 0)} item(s)\n"
+            f"Ready: {status_counts.get('ready', 0)} item(s)\n"
+            f"Failed: {status_counts.get('failed', 0)} item(s)\n\n"
+            f"Total: {sum(status_counts.values())} item(s)"
         )
         
         return result
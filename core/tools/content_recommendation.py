@@ -8,6 +8,7 @@ These tools query ContentItem and recommend items based on:
 """
 
 import logging
+import re
 from typing import List, Optional
 
 from core.services.django_mcp import DjangoMCPService
@@ -27,7 +28,7 @@ def recommend_content_for_download(
     personalized recommendations for the Download Agent.
     
     The recommendation algorithm:
-    1. Get user's active subscriptions (ordered by priority)
+    1. Get the sources of the user's active subscriptions
     2. Fetch ContentItem records from those sources (ALL available, no time filter)
     3. Filter by user's preferred topics (keyword matching)
     4. Return top N items with Content IDs
@@ -61,31 +62,30 @@ def recommend_content_for_download(
         if not prefs:
             return f"No preferences found for user {user_id}. Please set up preferences first."
         
-        # Get user subscriptions (ordered by priority)
-        subscriptions = Subscription.objects.filter(
+        # Get the source IDs of the user's active subscriptions; nothing else
+        # about the subscription or its source is read
+        source_ids = list(Subscription.objects.filter(
             user_id=user_id,
             is_active=True,
             source__is_active=True
-        ).select_related('source').order_by('-priority')
+        ).values_list('source_id', flat=True))
         
-        if not subscriptions.exists():
+        if not source_ids:
             return (
                 "No active subscriptions found. "
                 "Please subscribe to some content sources first."
             )
         
-        # Get source IDs
-        source_ids = [sub.source_id for sub in subscriptions]
-        
         # Fetch ContentItem records from subscribed sources that have storage_url
         # IMPORTANT: Only recommend items that are cached in S3/Supabase
         # This prevents downloading from original URLs that may be blocked (403)
-        available_items = ContentItem.objects.filter(
+        available_items = ContentItem.objects.cached().filter(
             source_id__in=source_ids,
-            storage_url__isnull=False,  # MUST have storage URL
-        ).exclude(
-            storage_url=''  # Exclude empty strings
-        ).select_related('source').order_by('-published_at')[:100]  # Limit to 100 most recent
+        ).select_related('source').only(
+            # Just the columns the filter and the listing below read
+            'id', 'title', 'description', 'published_at', 'media_url',
+            'storage_url', 'storage_provider', 'source__name',
+        ).order_by('-published_at')[:100]  # Limit to 100 most recent
         
         if not available_items:
             return (
@@ -95,25 +95,23 @@ def recommend_content_for_download(
                 "Tip: Check the ETL logs for download errors (403 Forbidden, etc.)"
             )
         
-        # Filter by user topics (simple keyword matching)
+        # Filter by user topics (simple keyword matching): one case-insensitive
+        # alternation instead of lowercasing title/description per topic
+        topic_pattern = None
+        if prefs.topics:
+            topic_pattern = re.compile(
+                '|'.join(re.escape(topic) for topic in prefs.topics),
+                re.IGNORECASE,
+            )
+        
         recommended = []
         
         for item in available_items:
             # Check if any user topic appears in title or description
-            matches_topic = False
-            
-            if prefs.topics:
-                for topic in prefs.topics:
-                    topic_lower = topic.lower()
-                    if (topic_lower in item.title.lower() or
-                        topic_lower in item.description.lower()):
-                        matches_topic = True
-                        break
-            else:
-                # No topic filter set, accept all
-                matches_topic = True
-            
-            if matches_topic:
+            # (no topic filter set: accept all)
+            if (topic_pattern is None or
+                    topic_pattern.search(item.title) or
+                    topic_pattern.search(item.description)):
                 recommended.append(item)
             
             if len(recommended) >= max_items:
@@ -157,7 +155,7 @@ def recommend_content_for_download(
         
         # Add clear instruction for Download Agent
         result += (
-            f"💡 Download Agent: To queue these items, call queue_download for each Content ID.\n"
+            f"💡 Download Agent: To queue these items, call queue_downloads with these Content IDs.\n"
             f"Content IDs to queue: {content_ids}"
         )
         
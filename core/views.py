@@ -3,10 +3,12 @@ from django.contrib.auth import views as auth_views, login as django_login, logo
 from django.contrib.auth.models import User
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
+from django.core.cache import cache
 from django.http import JsonResponse, FileResponse, Http404
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.db import transaction
+from django.db.models import Count
 from asgiref.sync import sync_to_async
 from rest_framework import viewsets, permissions, status, serializers
 from rest_framework.decorators import action, api_view, permission_classes
@@ -15,12 +17,27 @@ from rest_framework.response import Response
 import os
 from .models import (
     UserPreference, CommuteWindow, ContentSource, 
-    Subscription, DownloadItem
+    Subscription, DownloadItem, ContentItem, ContentItemQuerySet
 )
 from .serializers import (
     UserPreferenceSerializer, CommuteWindowSerializer,
     ContentSourceSerializer, SubscriptionSerializer, DownloadItemSerializer
 )
+from .tasks import manual_ingest_source
+
+# Dashboard counts are cached briefly per user to spare three COUNT queries
+# on every page load
+DASHBOARD_COUNTS_TTL = 60
+
+def _dashboard_counts_key(user_id):
+    return f"dash:{user_id}"
+
+def _dashboard_counts(user):
+    return {
+        'commute_count': CommuteWindow.objects.filter(user=user).count(),
+        'subscription_count': Subscription.objects.filter(user=user).count(),
+        'download_count': DownloadItem.objects.filter(user=user).count(),
+    }
 
 # Template Views
 def index(request):
@@ -31,11 +48,11 @@ def index(request):
     }
     
     if request.user.is_authenticated:
-        context.update({
-            'commute_count': CommuteWindow.objects.filter(user=request.user).count(),
-            'subscription_count': Subscription.objects.filter(user=request.user).count(),
-            'download_count': DownloadItem.objects.filter(user=request.user).count(),
-        })
+        context.update(cache.get_or_set(
+            _dashboard_counts_key(request.user.id),
+            lambda: _dashboard_counts(request.user),
+            DASHBOARD_COUNTS_TTL
+        ))
     
     return render(request, 'index.html', context)
 
@@ -46,6 +63,7 @@ def commutes(request):
     return render(request, 'commutes.html', {'commutes': user_commutes})
 
 @login_required
+@ensure_csrf_cookie
 def sources(request):
     """Content sources and subscription management"""
     available_sources = ContentSource.objects.filter(is_active=True)
@@ -59,7 +77,10 @@ def sources(request):
 @login_required
 def downloads(request):
     """Downloads listing"""
-    user_downloads = DownloadItem.objects.filter(user=request.user).order_by('-created_at')
+    # The listing never shows the long text columns
+    user_downloads = DownloadItem.objects.filter(user=request.user).select_related('source').defer(
+        'description', 'error_message'
+    ).order_by('-created_at')
     return render(request, 'downloads.html', {'downloads': user_downloads})
 
 # HTMX Views for dynamic interactions
@@ -67,22 +88,27 @@ def downloads(request):
 @require_http_methods(["POST"])
 def toggle_subscription(request, source_id):
     """Toggle subscription via HTMX"""
-    source = get_object_or_404(ContentSource, id=source_id)
-    subscription, created = Subscription.objects.get_or_create(
-        user=request.user,
-        source=source,
-        defaults={'priority': 1}
-    )
-    
-    if not created:
-        subscription.delete()
+    # Unsubscribe if a row was there to delete, otherwise subscribe
+    deleted, _ = Subscription.objects.filter(user=request.user, source_id=source_id).delete()
+    
+    if deleted:
         action = 'unsubscribed'
+        source_name = ContentSource.objects.filter(id=source_id).values_list('name', flat=True).first()
     else:
+        source = get_object_or_404(ContentSource.objects.only('id', 'name'), id=source_id)
+        # get_or_create, so a concurrent subscribe to the same source doesn't
+        # trip the (user, source) unique constraint
+        Subscription.objects.get_or_create(
+            user=request.user, source=source, defaults={'priority': 1}
+        )
         action = 'subscribed'
+        source_name = source.name
+    
+    cache.delete(_dashboard_counts_key(request.user.id))
     
     return JsonResponse({
         'action': action,
-        'source_name': source.name
+        'source_name': source_name
     })
 
 # API ViewSets
@@ -138,7 +164,8 @@ class DownloadItemViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
-        return DownloadItem.objects.filter(user=self.request.user)
+        # The serializer reads source.name, so join it instead of one query per row
+        return DownloadItem.objects.filter(user=self.request.user).select_related('source')
 
 
 # New API Endpoints for React Frontend
@@ -213,19 +240,17 @@ def register_user(request):
             
             # Create subscriptions if any sources were selected
             if subscription_ids:
-                subscriptions_to_create = []
-                for source_id in subscription_ids:
-                    try:
-                        source = ContentSource.objects.get(id=source_id, is_active=True)
-                        subscriptions_to_create.append(
-                            Subscription(user=user, source=source, priority=1)
-                        )
-                    except ContentSource.DoesNotExist:
-                        # Skip invalid source IDs
-                        pass
+                # Validate all IDs in one query; invalid/inactive ones are skipped
+                valid_source_ids = set(ContentSource.objects.filter(
+                    id__in=subscription_ids,
+                    is_active=True
+                ).values_list('id', flat=True))
                 
-                if subscriptions_to_create:
-                    Subscription.objects.bulk_create(subscriptions_to_create)
+                if valid_source_ids:
+                    Subscription.objects.bulk_create([
+                        Subscription(user=user, source_id=source_id, priority=1)
+                        for source_id in valid_source_ids
+                    ])
         
         # Auto-login the user (handle both sync and async contexts)
         try:
@@ -321,7 +346,6 @@ def logout_user(request):
     
     # If it's a browser GET request, redirect to login
     if request.method == 'GET':
-        from django.shortcuts import redirect
         return redirect('/login/')
     
     return Response({
@@ -397,8 +421,8 @@ def download_file(request, download_id):
     Returns: File download response
     """
     try:
-        # Get the download item
-        download_item = DownloadItem.objects.select_related('source').get(
+        # Get the download item (only the columns needed to serve it)
+        download_item = DownloadItem.objects.only('id', 'status', 'local_file_path').get(
             id=download_id,
             user=request.user
         )
@@ -410,8 +434,11 @@ def download_file(request, download_id):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Check if file exists
-        if not download_item.local_file_path or not os.path.exists(download_item.local_file_path):
+        # Open the file up front; a missing file surfaces as FileNotFoundError
+        # here instead of needing a separate exists() probe
+        try:
+            file_handle = open(download_item.local_file_path or '', 'rb')
+        except FileNotFoundError:
             return Response(
                 {'error': 'File not found on server'},
                 status=status.HTTP_404_NOT_FOUND
@@ -428,13 +455,12 @@ def download_file(request, download_id):
         content_type = content_type_map.get(file_ext, 'application/octet-stream')
         
         # Serve the file
-        file_handle = open(download_item.local_file_path, 'rb')
         response = FileResponse(file_handle, content_type=content_type)
         
-        # Set download headers
+        # Set download headers (size comes from the already-open descriptor)
         filename = os.path.basename(download_item.local_file_path)
         response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        response['Content-Length'] = os.path.getsize(download_item.local_file_path)
+        response['Content-Length'] = os.fstat(file_handle.fileno()).st_size
         
         return response
     
@@ -463,15 +489,16 @@ def trigger_etl_pipeline(request):
     Options (in request body):
     - source_type: Filter by type ('podcast', 'meme', 'news', or 'all')
     - clear_old: If True, clears old ContentItem records first (default: False)
+    - background: If True, queue one Celery task per source and return right
+      away instead of ingesting inside the request (default: False)
     
     Returns:
-        JSON with task status and results summary
+        JSON with task status and results summary (task IDs when background)
     """
-    from core.tasks import ingest_content_sources, manual_ingest_source
-    from core.models import ContentSource, ContentItem
-    
     source_type = request.data.get('source_type', 'all')
     clear_old = request.data.get('clear_old', False)
+    # Form-encoded bodies send strings, where 'false' would otherwise be truthy
+    background = str(request.data.get('background', False)).lower() in ('1', 'true', 'yes')
     
     try:
         # Optionally clear old content first
@@ -486,13 +513,24 @@ def trigger_etl_pipeline(request):
             sources = ContentSource.objects.filter(is_active=True)
         else:
             sources = ContentSource.objects.filter(is_active=True, type=source_type)
+        sources = list(sources)
         
-        if not sources.exists():
+        if not sources:
             return Response({
                 'status': 'warning',
                 'message': f'{clear_message}No active sources found for type: {source_type}'
             })
         
+        # Fire-and-forget: the worker pool does the fetching, so a slow feed
+        # doesn't hold this request (and a web worker) open
+        if background:
+            task_ids = [manual_ingest_source.delay(source.id).id for source in sources]
+            return Response({
+                'status': 'queued',
+                'message': f'{clear_message}ETL pipeline queued for {len(task_ids)} sources.',
+                'task_ids': task_ids
+            }, status=status.HTTP_202_ACCEPTED)
+        
         # Trigger ingestion for each source
         results = []
         for source in sources:
@@ -532,8 +570,6 @@ def clear_content_pool(request):
     Returns:
         JSON with count of deleted items
     """
-    from core.models import ContentItem, DownloadItem
-    
     try:
         # Delete all content items
         content_deleted = ContentItem.objects.all().delete()[0]
@@ -566,18 +602,19 @@ def get_etl_status(request):
     
     Returns counts of content items by source type and storage status.
     """
-    from core.models import ContentSource, ContentItem
-    from django.db.models import Count
-    
     try:
         # Get content counts by source type
         content_by_type = ContentItem.objects.values('source__type').annotate(
             count=Count('id')
         ).order_by('source__type')
         
-        # Get content with storage (ready for download)
-        cached_count = ContentItem.objects.exclude(storage_url='').exclude(storage_url__isnull=True).count()
-        total_count = ContentItem.objects.count()
+        # Total and cached-in-storage (ready for download) counts in one query
+        totals = ContentItem.objects.aggregate(
+            total=Count('id'),
+            cached=Count('id', filter=ContentItemQuerySet.CACHED),
+        )
+        cached_count = totals['cached']
+        total_count = totals['total']
         
         # Get active sources
         sources = ContentSource.objects.filter(is_active=True).values('name', 'type')
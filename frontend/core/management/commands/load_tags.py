@@ -1,20 +1,40 @@
 import json
+from pathlib import Path
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from core.models import Category, Tag
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class Command(BaseCommand):
     help = "Load placeholder categories and tags into PostgreSQL"
 
     def handle(self, *args, **kwargs):
-        with open('tags.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)['categories']
+        raw = Path('tags.json').read_bytes()
+        data = (orjson.loads(raw) if orjson else json.loads(raw))['categories']
 
-        for key, info in data.items():
-            cat, _ = Category.objects.get_or_create(
-                key=key,
-                display_name=info['display_name']
+        with transaction.atomic():
+            # Create missing categories in one INSERT, then map key -> Category
+            existing_keys = set(Category.objects.filter(key__in=data.keys()).values_list('key', flat=True))
+            Category.objects.bulk_create(
+                [Category(key=key, display_name=info['display_name'])
+                 for key, info in data.items() if key not in existing_keys],
+                ignore_conflicts=True,
             )
-            for tag_name in info['tags']:
-                Tag.objects.get_or_create(category=cat, name=tag_name)
+            categories = Category.objects.in_bulk(list(data.keys()), field_name='key')
+
+            # Tag has no unique constraint, so skip pairs that already exist ourselves
+            existing_tags = set(Tag.objects.filter(category__in=categories.values()).values_list('category_id', 'name'))
+            new_tags = []
+            for key, info in data.items():
+                cat = categories[key]
+                for tag_name in info['tags']:
+                    if (cat.id, tag_name) not in existing_tags:
+                        existing_tags.add((cat.id, tag_name))
+                        new_tags.append(Tag(category=cat, name=tag_name))
+            Tag.objects.bulk_create(new_tags, batch_size=1000)
 
         self.stdout.write(self.style.SUCCESS("Tags loaded successfully!"))
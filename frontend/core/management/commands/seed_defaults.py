@@ -50,33 +50,43 @@ class Command(BaseCommand):
             }
         ]
         
+        # Names that already exist, only used to report created vs updated
+        existing_names = set(
+            ContentSource.objects.filter(
+                name__in=[source_data['name'] for source_data in sources]
+            ).values_list('name', flat=True)
+        )
+        
+        # Refresh every seeded field except the conflict key itself
+        update_fields = sorted(
+            {field for source_data in sources for field in source_data} - {'name'}
+        )
+        
+        # Single INSERT ... ON CONFLICT (name) DO UPDATE for all sources
+        ContentSource.objects.bulk_create(
+            [ContentSource(**source_data) for source_data in sources],
+            update_conflicts=True,
+            unique_fields=['name'],
+            update_fields=update_fields,
+        )
+        
         created_count = 0
         updated_count = 0
         
         for source_data in sources:
-            source, created = ContentSource.objects.get_or_create(
-                name=source_data['name'],
-                defaults=source_data
-            )
-            
-            if created:
-                created_count += 1
+            if source_data['name'] in existing_names:
+                updated_count += 1
                 self.stdout.write(
-                    self.style.SUCCESS(f'Created: {source.name}')
+                    self.style.WARNING(f'Updated: {source_data["name"]}')
                 )
             else:
-                # Update existing source
-                for key, value in source_data.items():
-                    if key != 'name':
-                        setattr(source, key, value)
-                source.save()
-                updated_count += 1
+                created_count += 1
                 self.stdout.write(
-                    self.style.WARNING(f'Updated: {source.name}')
+                    self.style.SUCCESS(f'Created: {source_data["name"]}')
                 )
         
         self.stdout.write(
             self.style.SUCCESS(
                 f'Seeding complete: {created_count} created, {updated_count} updated'
             )
-        )
\ No newline at end of file
+        )
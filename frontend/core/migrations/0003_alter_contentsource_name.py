@@ -0,0 +1,77 @@
+# Generated by Django 5.0.6 on 2026-10-16 09:12
+
+import logging
+
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+
+def merge_duplicate_content_sources(apps, schema_editor):
+    """
+    Fold ContentSources that share a name into the oldest one.
+
+    Downloads are repointed at the kept source; subscriptions are repointed
+    unless the user already subscribes to it, in which case the duplicate
+    subscription is dropped. This is not undone when the migration is reversed.
+    """
+    if schema_editor.connection.vendor == "postgresql":
+        # Fire the deferred FK checks per statement so no trigger events are
+        # left pending when the following ALTER TABLE runs in this transaction
+        schema_editor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+    ContentSource = apps.get_model("core", "ContentSource")
+    Subscription = apps.get_model("core", "Subscription")
+    DownloadItem = apps.get_model("core", "DownloadItem")
+    duplicate_names = (
+        ContentSource.objects.values("name")
+        .annotate(total=models.Count("id"))
+        .filter(total__gt=1)
+        .values_list("name", flat=True)
+    )
+    removed = 0
+    for name in duplicate_names:
+        ids = list(
+            ContentSource.objects.filter(name=name)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        keep_id, extra_ids = ids[0], ids[1:]
+        subscribed_users = Subscription.objects.filter(
+            source_id=keep_id
+        ).values_list("user_id", flat=True)
+        Subscription.objects.filter(
+            source_id__in=extra_ids, user_id__in=subscribed_users
+        ).delete()
+        # Collapse a user's subscriptions to several duplicates into one
+        for user_id in (
+            Subscription.objects.filter(source_id__in=extra_ids)
+            .values_list("user_id", flat=True)
+            .distinct()
+        ):
+            extra_subs = Subscription.objects.filter(
+                user_id=user_id, source_id__in=extra_ids
+            ).order_by("id")
+            Subscription.objects.filter(
+                id__in=list(extra_subs.values_list("id", flat=True)[1:])
+            ).delete()
+        Subscription.objects.filter(source_id__in=extra_ids).update(source_id=keep_id)
+        DownloadItem.objects.filter(source_id__in=extra_ids).update(source_id=keep_id)
+        removed += ContentSource.objects.filter(id__in=extra_ids).delete()[0]
+    if removed:
+        logger.info("Merged %d duplicate ContentSource row(s)", removed)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_category_tag"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_content_sources, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="contentsource",
+            name="name",
+            field=models.CharField(max_length=200, unique=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.6 on 2026-10-16 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_alter_contentsource_name"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="contentsource",
+            name="is_active",
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AddIndex(
+            model_name="commutewindow",
+            index=models.Index(
+                fields=["user", "is_active"], name="core_commut_user_id_40a47d_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="downloaditem",
+            index=models.Index(
+                fields=["created_at"], name="core_downlo_created_cfd8de_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="subscription",
+            index=models.Index(
+                fields=["user", "is_active"], name="core_subscr_user_id_6ccc59_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.0.6 on 2026-10-16 11:05
+
+import logging
+
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+# When several rows share (user, source, original_url), keep the one furthest
+# along; ties go to the oldest row
+STATUS_RANK = {"ready": 3, "downloading": 2, "queued": 1, "failed": 0}
+
+
+def remove_duplicate_download_items(apps, schema_editor):
+    """
+    Delete duplicate DownloadItems so the unique constraint can be added.
+    
+    This is data loss: the removed rows are not restored when the migration
+    is reversed.
+    """
+    if schema_editor.connection.vendor == "postgresql":
+        # Fire the deferred FK checks per statement so no trigger events are
+        # left pending when the following ALTER TABLE runs in this transaction
+        schema_editor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+    DownloadItem = apps.get_model("core", "DownloadItem")
+    duplicates = (
+        DownloadItem.objects.values("user", "source", "original_url")
+        .annotate(total=models.Count("id"))
+        .filter(total__gt=1)
+    )
+    
+    deleted = 0
+    for dup in duplicates:
+        rows = list(
+            DownloadItem.objects.filter(
+                user=dup["user"],
+                source=dup["source"],
+                original_url=dup["original_url"],
+            ).values_list("id", "status")
+        )
+        keep_id = max(rows, key=lambda row: (STATUS_RANK.get(row[1], -1), -row[0]))[0]
+        deleted += DownloadItem.objects.filter(
+            id__in=[row_id for row_id, _ in rows if row_id != keep_id]
+        ).delete()[0]
+    
+    if deleted:
+        logger.info("Removed %d duplicate DownloadItem row(s)", deleted)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_alter_contentsource_is_active_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_download_items, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="downloaditem",
+            constraint=models.UniqueConstraint(
+                fields=("user", "source", "original_url"), name="uniq_user_source_url"
+            ),
+        ),
+    ]
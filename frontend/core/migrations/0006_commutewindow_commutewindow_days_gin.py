@@ -0,0 +1,49 @@
+# Generated by Django 5.0.6 on 2026-10-16 11:20
+
+import django.contrib.postgres.indexes
+import django.db.models.expressions
+from django.db import migrations
+
+
+def create_days_gin_index(apps, schema_editor):
+    # jsonb_path_ops GIN indexes only exist on PostgreSQL; other backends
+    # (e.g. a local SQLite test database) simply go without it
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS commutewindow_days_gin "
+        "ON core_commutewindow USING gin (days_of_week jsonb_path_ops)"
+    )
+
+
+def drop_days_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS commutewindow_days_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_downloaditem_uniq_user_source_url"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_days_gin_index, drop_days_gin_index),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="commutewindow",
+                    index=django.contrib.postgres.indexes.GinIndex(
+                        django.contrib.postgres.indexes.OpClass(
+                            django.db.models.expressions.F("days_of_week"),
+                            name="jsonb_path_ops",
+                        ),
+                        name="commutewindow_days_gin",
+                    ),
+                ),
+            ],
+        ),
+    ]
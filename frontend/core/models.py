@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models import F
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.utils import timezone
 import json
 
@@ -36,6 +38,17 @@ class CommuteWindow(models.Model):
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'is_active']),
+            # Serves the nightly task's days_of_week__contains (jsonb @>) filter;
+            # migration 0006 only creates it on PostgreSQL
+            GinIndex(
+                OpClass(F('days_of_week'), name='jsonb_path_ops'),
+                name='commutewindow_days_gin',
+            ),
+        ]
+    
     def __str__(self):
         return f"{self.user.username} - {self.label}"
 
@@ -50,7 +63,7 @@ class ContentSource(models.Model):
         ('cache_allowed', 'Cache Allowed'),
     ]
     
-    name = models.CharField(max_length=200)
+    name = models.CharField(max_length=200, unique=True)
     type = models.CharField(max_length=20, choices=TYPE_CHOICES)
     feed_url = models.URLField()
     policy = models.CharField(
@@ -58,7 +71,7 @@ class ContentSource(models.Model):
         choices=POLICY_CHOICES, 
         default='metadata_only'
     )
-    is_active = models.BooleanField(default=True)
+    is_active = models.BooleanField(default=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
     def __str__(self):
@@ -73,6 +86,9 @@ class Subscription(models.Model):
     
     class Meta:
         unique_together = ['user', 'source']
+        indexes = [
+            models.Index(fields=['user', 'is_active']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} -> {self.source.name}"
@@ -95,6 +111,19 @@ class DownloadItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'source', 'original_url'],
+                name='uniq_user_source_url',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['created_at']),
+            # Per-user listings, newest first
+            models.Index(fields=['user', '-created_at']),
+        ]
+    
     def __str__(self):
         return f"{self.title} [{self.get_status_display()}]"
 
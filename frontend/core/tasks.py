@@ -1,15 +1,38 @@
 from celery import shared_task
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
 from datetime import datetime, timedelta, time
 import feedparser
 import logging
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .models import (
-    CommuteWindow, Subscription, ContentSource, DownloadItem
+    Subscription, ContentSource, DownloadItem
 )
 
 logger = logging.getLogger(__name__)
 
+# One pooled session per worker process, so feed fetches reuse keep-alive
+# connections; transient gateway errors are retried with a short backoff, and
+# the last response is returned (not raised as RetryError) once retries run out
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
 @shared_task
 def nightly_prepare_content():
     """
@@ -21,85 +44,128 @@ def nightly_prepare_content():
     processed_users = 0
     created_items = 0
     
-    # Get all users with active commute windows
+    # Tomorrow's commute day and availability time (8 AM, simulated) are the
+    # same for every user, so compute them once
+    tomorrow = timezone.now().date() + timedelta(days=1)
+    day_name = tomorrow.strftime('%a')  # Mon, Tue, etc.
+    available_from = timezone.make_aware(
+        datetime.combine(tomorrow, time(8, 0))
+    )
+    
+    # Get all users with an active commute window tomorrow, along with their
+    # active subscriptions, in two queries total
     users_with_commutes = User.objects.filter(
-        commutewindow__is_active=True
-    ).distinct()
-    
-    for user in users_with_commutes:
-        try:
-            # Get user's active subscriptions
-            subscriptions = Subscription.objects.filter(
-                user=user, 
+        commutewindow__is_active=True,
+        commutewindow__days_of_week__contains=day_name
+    ).distinct().only('id', 'username').prefetch_related(
+        Prefetch(
+            'subscription_set',
+            # Only the columns the nightly run reads; the user FK is needed to
+            # attach each subscription to its user
+            queryset=Subscription.objects.filter(
                 is_active=True,
                 source__is_active=True
-            ).select_related('source')
-            
-            if not subscriptions.exists():
-                continue
-            
-            # Get user's commute windows for tomorrow
-            tomorrow = timezone.now().date() + timedelta(days=1)
-            day_name = tomorrow.strftime('%a')  # Mon, Tue, etc.
-            
-            commute_windows = CommuteWindow.objects.filter(
-                user=user,
-                is_active=True,
-                days_of_week__contains=day_name
-            )
-            
-            if not commute_windows.exists():
-                continue
-            
-            # Set availability time to 8 AM tomorrow (simulated)
-            available_from = timezone.make_aware(
-                datetime.combine(tomorrow, time(8, 0))
-            )
-            
-            # Process each subscription
-            for subscription in subscriptions:
-                try:
-                    items_created = _process_content_source(
-                        user, subscription.source, available_from
+            ).select_related('source').only(
+                'id', 'user', 'source', 'source__name', 'source__feed_url'
+            ),
+            to_attr='active_subscriptions'
+        )
+    )
+    
+    users_with_commutes = list(users_with_commutes)
+    
+    # Many users share the same sources: fetch and parse each distinct feed
+    # once per run (concurrently, it's network-bound) instead of per user
+    sources = {
+        subscription.source_id: subscription.source
+        for user in users_with_commutes
+        for subscription in user.active_subscriptions
+    }
+    feeds = _parse_feeds(sources.values())
+    
+    # Conflicting rows are skipped silently on insert, so load the
+    # (user, source, url) keys already stored for this run's feed entries
+    # once, to count what each user's insert actually adds
+    feed_urls = {
+        entry.get('link', '')
+        for feed in feeds.values()
+        for entry in feed.entries[:5]
+    }
+    existing_keys = set(
+        DownloadItem.objects.filter(
+            user__in=users_with_commutes,
+            source_id__in=list(sources),
+            original_url__in=feed_urls,
+        ).values_list('user_id', 'source_id', 'original_url')
+    )
+    
+    # One transaction (one commit/WAL flush) for the whole run rather than
+    # one per user
+    with transaction.atomic():
+        for user in users_with_commutes:
+            try:
+                # Get user's active subscriptions
+                subscriptions = user.active_subscriptions
+                
+                if not subscriptions:
+                    continue
+                
+                # Process each subscription, collecting new items for one batched INSERT
+                pending_items = []
+                for subscription in subscriptions:
+                    try:
+                        pending_items.extend(_process_content_source(
+                            user, subscription.source, available_from,
+                            feeds.get(subscription.source_id)
+                        ))
+                    except Exception as e:
+                        logger.error(f"Error processing {subscription.source.name}: {e}")
+                
+                # Savepoint, so a failed insert only rolls back this user's items
+                with transaction.atomic():
+                    DownloadItem.objects.bulk_create(
+                        pending_items, batch_size=1000, ignore_conflicts=True
                     )
-                    created_items += items_created
-                except Exception as e:
-                    logger.error(f"Error processing {subscription.source.name}: {e}")
-            
-            processed_users += 1
-            
-        except Exception as e:
-            logger.error(f"Error processing user {user.username}: {e}")
+                
+                new_keys = {
+                    (user.id, item.source_id, item.original_url)
+                    for item in pending_items
+                } - existing_keys
+                created_items += len(new_keys)
+                
+                processed_users += 1
+                
+            except Exception as e:
+                logger.error(f"Error processing user {user.username}: {e}")
     
     logger.info(f"Nightly preparation complete: {processed_users} users, {created_items} items created")
     return {'processed_users': processed_users, 'created_items': created_items}
 
-def _process_content_source(user, source, available_from):
+def _process_content_source(user, source, available_from, feed):
     """
     Process a single content source for a user.
-    For Sprint-1, this creates placeholder items based on RSS feed parsing.
+    For Sprint-1, this builds placeholder items based on RSS feed parsing.
+    
+    Takes the source's already-parsed feed (None if it couldn't be fetched).
+    Returns a list of unsaved DownloadItem instances; the caller saves them
+    with bulk_create(ignore_conflicts=True), which drops ones already stored.
     """
-    created_count = 0
+    new_items = []
+    
+    if feed is None:
+        return new_items
     
     try:
-        # Parse RSS feed
-        feed = feedparser.parse(source.feed_url)
-        
         # Process up to 5 latest items
-        for entry in feed.entries[:5]:
+        entries = feed.entries[:5]
+        
+        for entry in entries:
             title = entry.get('title', 'Untitled')
             link = entry.get('link', '')
             
-            # Skip if we already have this item
-            if DownloadItem.objects.filter(
-                user=user, 
-                source=source, 
-                original_url=link
-            ).exists():
-                continue
-            
-            # Create download item
-            DownloadItem.objects.create(
+            # Build download item; ones we already have are skipped by the
+            # unique (user, source, original_url) constraint on insert
+            new_items.append(DownloadItem(
                 user=user,
                 source=source,
                 title=title[:300],  # Truncate to fit field
@@ -107,13 +173,49 @@ def _process_content_source(user, source, available_from):
                 media_url=entry.get('enclosures', [{}])[0].get('href') if entry.get('enclosures') else None,
                 status='ready',  # Simulated ready state for Sprint-1
                 available_from=available_from
-            )
-            created_count += 1
+            ))
     
     except Exception as e:
-        logger.error(f"Error parsing feed {source.feed_url}: {e}")
+        logger.error(f"Error processing feed {source.feed_url}: {e}")
     
-    return created_count
+    return new_items
+
+def _parse_feeds(sources, max_workers=8):
+    """
+    Fetch and parse the RSS feed of each source concurrently.
+    
+    Returns a dict of source id -> parsed feed; sources whose feed could not
+    be parsed are left out.
+    """
+    sources = list(sources)
+    feeds = {}
+    
+    if not sources:
+        return feeds
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sources))) as executor:
+        futures = {
+            executor.submit(_fetch_feed, source.feed_url): source
+            for source in sources
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                feeds[source.id] = future.result()
+            except Exception as e:
+                logger.error(f"Error parsing feed {source.feed_url}: {e}")
+    
+    return feeds
+
+def _fetch_feed(url, timeout=30):
+    """Download a feed over the shared session and parse it."""
+    response = _session.get(url, timeout=timeout)
+    response.raise_for_status()
+    # feedparser looks response headers up by lowercase name
+    return feedparser.parse(
+        response.content,
+        response_headers={k.lower(): v for k, v in response.headers.items()},
+    )
 
 @shared_task
 def cleanup_old_content():
@@ -135,5 +237,5 @@ def cleanup_old_content():
 
 @shared_task
 def add(x, y):
-    print(f"Adding {x} + {y}")
+    logger.info("Adding %s + %s", x, y)
     return x + y
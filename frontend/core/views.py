@@ -2,8 +2,10 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth import views as auth_views
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
+from django.views.decorators.csrf import ensure_csrf_cookie
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -16,6 +18,20 @@ from .serializers import (
     ContentSourceSerializer, SubscriptionSerializer, DownloadItemSerializer
 )
 
+# Dashboard counts are cached briefly per user to spare three COUNT queries
+# on every page load
+DASHBOARD_COUNTS_TTL = 60
+
+def _dashboard_counts_key(user_id):
+    return f"dash:{user_id}"
+
+def _dashboard_counts(user):
+    return {
+        'commute_count': CommuteWindow.objects.filter(user=user).count(),
+        'subscription_count': Subscription.objects.filter(user=user).count(),
+        'download_count': DownloadItem.objects.filter(user=user).count(),
+    }
+
 # Template Views
 def index(request):
     """Dashboard/Index page"""
@@ -25,11 +41,11 @@ def index(request):
     }
     
     if request.user.is_authenticated:
-        context.update({
-            'commute_count': CommuteWindow.objects.filter(user=request.user).count(),
-            'subscription_count': Subscription.objects.filter(user=request.user).count(),
-            'download_count': DownloadItem.objects.filter(user=request.user).count(),
-        })
+        context.update(cache.get_or_set(
+            _dashboard_counts_key(request.user.id),
+            lambda: _dashboard_counts(request.user),
+            DASHBOARD_COUNTS_TTL
+        ))
     
     return render(request, 'index.html', context)
 
@@ -40,6 +56,7 @@ def commutes(request):
     return render(request, 'commutes.html', {'commutes': user_commutes})
 
 @login_required
+@ensure_csrf_cookie
 def sources(request):
     """Content sources and subscription management"""
     available_sources = ContentSource.objects.filter(is_active=True)
@@ -53,7 +70,7 @@ def sources(request):
 @login_required
 def downloads(request):
     """Downloads listing"""
-    user_downloads = DownloadItem.objects.filter(user=request.user).order_by('-created_at')
+    user_downloads = DownloadItem.objects.filter(user=request.user).select_related('source').order_by('-created_at')
     return render(request, 'downloads.html', {'downloads': user_downloads})
 
 # HTMX Views for dynamic interactions
@@ -61,22 +78,27 @@ def downloads(request):
 @require_http_methods(["POST"])
 def toggle_subscription(request, source_id):
     """Toggle subscription via HTMX"""
-    source = get_object_or_404(ContentSource, id=source_id)
-    subscription, created = Subscription.objects.get_or_create(
-        user=request.user,
-        source=source,
-        defaults={'priority': 1}
-    )
+    # Unsubscribe if a row was there to delete, otherwise subscribe
+    deleted, _ = Subscription.objects.filter(user=request.user, source_id=source_id).delete()
     
-    if not created:
-        subscription.delete()
+    if deleted:
         action = 'unsubscribed'
+        source_name = ContentSource.objects.filter(id=source_id).values_list('name', flat=True).first()
     else:
+        source = get_object_or_404(ContentSource.objects.only('id', 'name'), id=source_id)
+        # get_or_create, so a concurrent subscribe to the same source doesn't
+        # trip the (user, source) unique constraint
+        Subscription.objects.get_or_create(
+            user=request.user, source=source, defaults={'priority': 1}
+        )
         action = 'subscribed'
+        source_name = source.name
+    
+    cache.delete(_dashboard_counts_key(request.user.id))
     
     return JsonResponse({
         'action': action,
-        'source_name': source.name
+        'source_name': source_name
     })
 
 # API ViewSets
@@ -120,4 +142,5 @@ class DownloadItemViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
-        return DownloadItem.objects.filter(user=self.request.user)
\ No newline at end of file
+        # The serializer reads source.name, so join it instead of one query per row
+        return DownloadItem.objects.filter(user=self.request.user).select_related('source')
\ No newline at end of file
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 import dj_database_url
+from celery.schedules import crontab
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -79,6 +80,12 @@ DATABASES = {
         'PASSWORD': os.getenv('PG_PASSWORD', 'StrongPassword123!'),
         'HOST': os.getenv('PG_HOST', 'localhost'),
         'PORT': os.getenv('PG_PORT', '5432'),
+        # Reuse connections across requests/tasks instead of reconnecting each time
+        'CONN_MAX_AGE': int(os.getenv('CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'connect_timeout': 3,
+        },
     }
 }
 
@@ -129,6 +136,23 @@ REST_FRAMEWORK = {
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = DEBUG  # Only in development
 
+# Cache: shared Redis cache when REDIS_URL is set, so web processes and
+# Celery workers see the same entries; per-process memory cache otherwise
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+            'KEY_PREFIX': 'smartcache-frontend',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Celery Configuration
 CELERY_BROKER_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
@@ -141,13 +165,23 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_BEAT_SCHEDULE = {
     'nightly-content-preparation': {
         'task': 'core.tasks.nightly_prepare_content',
-        'schedule': 60.0 * 60.0 * 24,  # Daily at midnight
+        'schedule': crontab(hour=2, minute=0),  # Daily at 2 AM
     },
     'cleanup-old-content': {
         'task': 'core.tasks.cleanup_old_content',
-        'schedule': 60.0 * 60.0 * 24 * 7,  # Weekly
+        'schedule': crontab(hour=3, minute=0, day_of_week=0),  # Sunday at 3 AM
     },
 }
 
-# Static files storage
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
\ No newline at end of file
+# Static files storage (STORAGES replaces STATICFILES_STORAGE, which Django
+# 5.1 no longer reads). collectstatic writes hashed names plus .gz, and .br
+# when the brotli package is installed; WhiteNoise serves the hashed files
+# with a far-future Cache-Control.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
\ No newline at end of file
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 import dj_database_url
+from celery.schedules import crontab
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -29,6 +30,7 @@ DJANGO_APPS = [
 
 THIRD_PARTY_APPS = [
     'rest_framework',
+    'rest_framework.authtoken',
     'corsheaders',
     'channels',
 ]
@@ -72,10 +74,20 @@ TEMPLATES = [
 WSGI_APPLICATION = 'smartcache.wsgi.application'
 
 # Database
+# Persistent connections are opt-in: the default image serves through ASGI
+# (daphne), where Django can't close persistent connections reliably. WSGI
+# (gunicorn) and Celery workers set CONN_MAX_AGE (e.g. 600) to reuse
+# connections across requests/tasks instead of reconnecting each time.
+CONN_MAX_AGE = int(os.getenv('CONN_MAX_AGE', '0'))
+
 DATABASE_URL = os.getenv('DATABASE_URL')
 if DATABASE_URL:
     DATABASES = {
-        'default': dj_database_url.parse(DATABASE_URL)
+        'default': dj_database_url.parse(
+            DATABASE_URL,
+            conn_max_age=CONN_MAX_AGE,
+            conn_health_checks=True,
+        )
     }
 else:
     # SQLite fallback for preview safety
@@ -129,7 +141,12 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        # Session auth stays first: DRF takes the WWW-Authenticate header from
+        # the first class, and the SPA expects 403 (not 401) when logged out.
+        # API clients sending "Authorization: Token <key>" fall through to
+        # TokenAuthentication
         'core.authentication.CsrfExemptSessionAuthentication',
+        'rest_framework.authentication.TokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -164,6 +181,23 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Cache: shared Redis cache when REDIS_URL is set, so web processes and
+# Celery workers see the same entries; per-process memory cache otherwise
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+            'KEY_PREFIX': 'smartcache',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Celery Configuration
 CELERY_BROKER_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
@@ -172,12 +206,31 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
-# Celery Beat Schedule (configured in smartcache/celery.py with crontab)
-# Left here for reference, but actual schedule is in celery.py
-CELERY_BEAT_SCHEDULE = {}
+# Celery Beat Schedule (the single source of truth; celery.py reads it via
+# the CELERY_ namespace)
+CELERY_BEAT_SCHEDULE = {
+    'ingest-content-every-6-hours': {
+        'task': 'core.tasks.ingest_content_sources',
+        'schedule': crontab(minute=0, hour='*/6'),  # Every 6 hours (0:00, 6:00, 12:00, 18:00)
+    },
+    'cleanup-old-content-weekly': {
+        'task': 'core.tasks.cleanup_old_content',
+        'schedule': crontab(hour=2, minute=0, day_of_week=0),  # Sunday at 2 AM
+    },
+}
 
-# Static files storage
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Static files storage (STORAGES replaces STATICFILES_STORAGE, which Django
+# 5.1 no longer reads). collectstatic writes hashed names plus .gz, and .br
+# when the brotli package is installed; WhiteNoise serves the hashed files
+# with a far-future Cache-Control.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
 
 # Cloud Storage Configuration (AWS S3 / Supabase)
 STORAGE_PROVIDER = os.getenv('STORAGE_PROVIDER', 'none')  # Options: 'aws_s3', 'supabase', 'none'
@@ -193,6 +246,11 @@ SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY')
 SUPABASE_BUCKET = os.getenv('SUPABASE_BUCKET', 'media')
 
+# ETL Settings
+ETL_MAX_WORKERS = int(os.getenv('ETL_MAX_WORKERS', '4'))  # Sources ingested concurrently
+ETL_MEDIA_WORKERS = int(os.getenv('ETL_MEDIA_WORKERS', '4'))  # Media downloads per source in flight
+ETL_API_CACHE_TTL = int(os.getenv('ETL_API_CACHE_TTL', '900'))  # Seconds to reuse YouTube/NewsAPI listings (0 disables)
+
 # Ollama Settings (for AutoGen)
 OLLAMA_BASE_URL = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
 OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'llama3')
\ No newline at end of file